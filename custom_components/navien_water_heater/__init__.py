@@ -1,41 +1,89 @@
 """The Navien NaviLink Water Heater Integration."""
 from __future__ import annotations
+from dataclasses import dataclass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr
-from .navien_api import NavilinkAccountCoordinator
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from .navien_api import MgppDevice, NavilinkAccountCoordinator
 from .const import DOMAIN
 import logging
 import os
 
 _LOGGER = logging.getLogger(__name__)
 
+# AWS IoT root CA bundled with the integration, resolved once at import
+AWS_CERT_PATH = os.path.join(os.path.dirname(__file__), "cert", "AmazonRootCA1.pem")
+
 PLATFORMS: list[str] = ["water_heater", "sensor", "switch", "binary_sensor", "number"]
 
+# Platforms that only have entities for MGPP devices
+MGPP_ONLY_PLATFORMS: set[str] = {"binary_sensor", "number"}
+
+# Seconds to wait for a burst of device registry updates to settle
+REGISTRY_SYNC_COOLDOWN = 0.5
+
+
+@dataclass
+class NavienData:
+    """Runtime data stored on the config entry."""
+
+    coordinator: NavilinkAccountCoordinator
+    platforms: list[str]  # Platforms forwarded at setup, unloaded together
+    entity_registry: er.EntityRegistry  # Looked up once, shared by platform setup
+
+
+NavienConfigEntry = ConfigEntry[NavienData]
 
-def _get_disabled_device_identifiers(hass: HomeAssistant) -> set[str]:
-    """Get the set of Navien device identifiers that are disabled in the device registry."""
+
+def _get_disabled_device_identifiers(hass: HomeAssistant, entry: NavienConfigEntry) -> set[str]:
+    """Get the set of Navien device identifiers for this entry that are disabled in the device registry."""
     disabled_identifiers = set()
     device_registry = dr.async_get(hass)
     
-    for device in device_registry.devices.values():
-        # Check if this is a Navien device
+    # Only devices belonging to this config entry, via the registry's index
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if device.disabled_by is None:
+            continue
         for domain, identifier in device.identifiers:
-            if domain == DOMAIN and device.disabled_by is not None:
+            if domain == DOMAIN:
                 disabled_identifiers.add(identifier)
+                # A device has a single Navien identifier
+                break
     
     return disabled_identifiers
 
 
-def _sync_disabled_devices(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Sync disabled devices from HA device registry to the coordinator."""
-    coordinator = hass.data[DOMAIN].get(entry.entry_id)
-    if coordinator is None:
+def _get_needed_platforms(coordinator: NavilinkAccountCoordinator) -> list[str]:
+    """Return the platforms that will create entities for the coordinator's devices."""
+    if any(coordinator.devices_of(MgppDevice)):
+        return PLATFORMS
+    return [platform for platform in PLATFORMS if platform not in MGPP_ONLY_PLATFORMS]
+
+
+def _sync_disabled_device(hass: HomeAssistant, entry: NavienConfigEntry, device_id: str) -> None:
+    """Sync the disabled state of a single registry device to the coordinator.
+    
+    Only the device that changed is inspected, so registry updates for other
+    integrations never trigger a full scan of the device registry.
+    """
+    coordinator = entry.runtime_data.coordinator
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
         return
     
-    disabled_identifiers = _get_disabled_device_identifiers(hass)
+    for domain, identifier in device.identifiers:
+        if domain == DOMAIN:
+            coordinator.set_device_polling_disabled(identifier, device.disabled_by is not None)
+
+
+def _sync_disabled_devices(hass: HomeAssistant, entry: NavienConfigEntry) -> None:
+    """Sync disabled devices from HA device registry to the coordinator."""
+    coordinator = entry.runtime_data.coordinator
+    disabled_identifiers = _get_disabled_device_identifiers(hass, entry)
     coordinator.set_disabled_devices(disabled_identifiers)
-    _LOGGER.debug(f"Synced disabled devices to coordinator: {disabled_identifiers}")
+    _LOGGER.debug("Synced disabled devices to coordinator: %s", disabled_identifiers)
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -57,44 +105,67 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: NavienConfigEntry) -> bool:
     """Set up Navien NaviLink Water Heater Integration from a config entry."""
 
-    hass.data.setdefault(DOMAIN, {})
-    
-    # Build path to AWS certificate
-    aws_path = hass.config.path()
-    subdirs = ['custom_components', 'navien_water_heater', 'cert']
-    for subdir in subdirs:
-        aws_path = os.path.join(aws_path, subdir)
-
     # Create the account coordinator
     coordinator = NavilinkAccountCoordinator(
         userId=entry.data.get("username", ""),
         passwd=entry.data.get("password", ""),
         polling_interval=entry.data.get("polling_interval", 15),
-        aws_cert_path=os.path.join(aws_path, "AmazonRootCA1.pem")
+        aws_cert_path=AWS_CERT_PATH,
+        session=async_get_clientsession(hass),
     )
     
-    # Store coordinator in hass data
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-    
     # Start the coordinator (connects to all gateways)
     await coordinator.start()
     
-    # Forward setup to all platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Forward setup only to platforms that have entities for these devices
+    platforms = _get_needed_platforms(coordinator)
+    entry.runtime_data = NavienData(
+        coordinator=coordinator,
+        platforms=platforms,
+        entity_registry=er.async_get(hass),
+    )
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
     
-    # Sync disabled devices from device registry after platforms are set up
+    # Full sync of disabled devices once, after platforms are set up
     _sync_disabled_devices(hass, entry)
     
+    # Registry updates arrive in bursts (e.g. during startup), so collect the
+    # changed device ids and sync them together once the burst settles
+    pending_device_ids: set[str] = set()
+    
+    @callback
+    def async_sync_pending_devices() -> None:
+        """Sync all devices whose disabled state changed since the last run."""
+        for device_id in pending_device_ids:
+            _sync_disabled_device(hass, entry, device_id)
+        pending_device_ids.clear()
+    
+    debouncer = Debouncer(
+        hass, _LOGGER, cooldown=REGISTRY_SYNC_COOLDOWN, immediate=False,
+        function=async_sync_pending_devices,
+    )
+    entry.async_on_unload(debouncer.async_shutdown)
+    
     # Listen for device registry changes to update polling state
+    device_registry = dr.async_get(hass)
+    
     @callback
     def async_device_registry_updated(event) -> None:
         """Handle device registry updates."""
-        if event.data.get("action") == "update":
-            # Re-sync disabled devices when a device is updated
-            _sync_disabled_devices(hass, entry)
+        # Only updates that touch disabled_by can change the polling state
+        if event.data.get("action") != "update":
+            return
+        if "disabled_by" not in event.data.get("changes", {}):
+            return
+        # Ignore devices that belong to other config entries
+        device = device_registry.async_get(event.data["device_id"])
+        if device is None or entry.entry_id not in device.config_entries:
+            return
+        pending_device_ids.add(device.id)
+        debouncer.async_schedule_call()
     
     entry.async_on_unload(
         hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, async_device_registry_updated)
@@ -103,11 +174,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: NavienConfigEntry) -> bool:
     """Unload a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.disconnect()
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
+    await entry.runtime_data.coordinator.disconnect()
+    return await hass.config_entries.async_unload_platforms(entry, entry.runtime_data.platforms)
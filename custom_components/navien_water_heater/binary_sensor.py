@@ -8,62 +8,66 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .entity import NavienBaseEntity
-from .migration import get_legacy_unique_id_if_exists
+from .entity import NavienOnOffEntity
+from .migration import get_legacy_unique_id_if_exists, prime_unique_ids
 from .navien_api import MgppDevice
-from .const import DOMAIN
 import logging
+from operator import attrgetter
+from typing import NamedTuple
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class BinarySensorSpec(NamedTuple):
+    """Static description of an MGPP binary sensor."""
+
+    key: str
+    name: str
+    device_class: BinarySensorDeviceClass | None
+
+
+# MGPP diagnostic binary sensors, built once at import
+_MGPP_BINARY_SENSOR_SPECS = (
+    BinarySensorSpec('heatUpperUse', 'Upper Heating Element', BinarySensorDeviceClass.HEAT),
+    BinarySensorSpec('heatLowerUse', 'Lower Heating Element', BinarySensorDeviceClass.HEAT),
+    BinarySensorSpec('compUse', 'Heat Pump Compressor', BinarySensorDeviceClass.RUNNING),
+    BinarySensorSpec('evaFanUse', 'Evaporator Fan', BinarySensorDeviceClass.RUNNING),
+    BinarySensorSpec('eevUse', 'Electronic Expansion Valve', BinarySensorDeviceClass.RUNNING),
+    BinarySensorSpec('operationBusy', 'System Heating', BinarySensorDeviceClass.RUNNING),
+)
+
+# Only created when the device supports recirculation
+_MGPP_RECIRC_BINARY_SENSOR_SPECS = (
+    BinarySensorSpec('recircHotBtnReady', 'Hot Button Ready', None),
+    BinarySensorSpec('recircPumpOperationStatus', 'Recirculation Pump', BinarySensorDeviceClass.RUNNING),
+)
+
+_MGPP_RECIRC_DEVICE_BINARY_SENSOR_SPECS = _MGPP_BINARY_SENSOR_SPECS + _MGPP_RECIRC_BINARY_SENSOR_SPECS
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Navien binary sensors based on a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = []
+    coordinator = entry.runtime_data.coordinator
     
-    for device in coordinator.devices.values():
-        device_id = device.device_identifier
-        if isinstance(device, MgppDevice):
-            # MGPP diagnostic sensors - disabled by default
-            sensors.extend([
-                MgppBinarySensor(coordinator, device_id, 'heatUpperUse', 'Upper Heating Element',
-                                device_class=BinarySensorDeviceClass.HEAT, enabled_default=False,
-                                entity_category=EntityCategory.DIAGNOSTIC),
-                MgppBinarySensor(coordinator, device_id, 'heatLowerUse', 'Lower Heating Element',
-                                device_class=BinarySensorDeviceClass.HEAT, enabled_default=False,
-                                entity_category=EntityCategory.DIAGNOSTIC),
-                MgppBinarySensor(coordinator, device_id, 'compUse', 'Heat Pump Compressor',
-                                device_class=BinarySensorDeviceClass.RUNNING, enabled_default=False,
-                                entity_category=EntityCategory.DIAGNOSTIC),
-                MgppBinarySensor(coordinator, device_id, 'evaFanUse', 'Evaporator Fan',
-                                device_class=BinarySensorDeviceClass.RUNNING, enabled_default=False,
-                                entity_category=EntityCategory.DIAGNOSTIC),
-                MgppBinarySensor(coordinator, device_id, 'eevUse', 'Electronic Expansion Valve',
-                                device_class=BinarySensorDeviceClass.RUNNING, enabled_default=False,
-                                entity_category=EntityCategory.DIAGNOSTIC),
-                MgppBinarySensor(coordinator, device_id, 'operationBusy', 'System Heating',
-                                device_class=BinarySensorDeviceClass.RUNNING, enabled_default=False,
-                                entity_category=EntityCategory.DIAGNOSTIC),
-            ])
-            
-            # Recirculation binary sensors - only if device supports recirculation
-            if device.supports_recirculation:
-                sensors.extend([
-                    MgppBinarySensor(coordinator, device_id, 'recircHotBtnReady', 'Hot Button Ready',
-                                    enabled_default=False,
-                                    entity_category=EntityCategory.DIAGNOSTIC),
-                    MgppBinarySensor(coordinator, device_id, 'recircPumpOperationStatus', 'Recirculation Pump',
-                                    device_class=BinarySensorDeviceClass.RUNNING, enabled_default=False,
-                                    entity_category=EntityCategory.DIAGNOSTIC),
-                ])
+    # MGPP diagnostic sensors - disabled by default
+    sensors = [
+        MgppBinarySensor(coordinator, device.device_identifier, spec.key, spec.name,
+                         device_class=spec.device_class, enabled_default=False,
+                         entity_category=EntityCategory.DIAGNOSTIC)
+        for device in coordinator.devices_of(MgppDevice)
+        for spec in (
+            _MGPP_RECIRC_DEVICE_BINARY_SENSOR_SPECS if device.supports_recirculation
+            else _MGPP_BINARY_SENSOR_SPECS
+        )
+    ]
     
+    prime_unique_ids(hass, entry.runtime_data.entity_registry, "binary_sensor", sensors)
     async_add_entities(sensors)
 
 
-class MgppBinarySensor(NavienBaseEntity, BinarySensorEntity):
+class MgppBinarySensor(NavienOnOffEntity, BinarySensorEntity):
     """Representation of an MGPP diagnostic binary sensor"""
 
     def __init__(self, coordinator, device_identifier, sensor_key, name, device_class=None, enabled_default=True,
@@ -71,18 +75,22 @@ class MgppBinarySensor(NavienBaseEntity, BinarySensorEntity):
         super().__init__(coordinator, device_identifier)
         self.sensor_key = sensor_key
         self._attr_name = name
-        self._device_class = device_class
-        self._enabled_default = enabled_default
+        self._attr_device_class = device_class
+        self._attr_entity_registry_enabled_default = enabled_default
         self._attr_entity_category = entity_category
+        self._is_on_getter = attrgetter(f"status_flags.{MgppDevice.STATUS_FLAG_ATTRS[sensor_key]}")
+        # MGPP devices are identified by their MAC, so both formats are built without a device lookup
+        self._legacy_unique_id = f"{device_identifier}{sensor_key}"
+        self._new_unique_id = f"{device_identifier}_{sensor_key}"
         self._cached_unique_id = None
 
     def _get_legacy_unique_id(self) -> str:
         """Return legacy unique_id format: {mac}{key}"""
-        return f"{self.device.mac_address}{self.sensor_key}"
+        return self._legacy_unique_id
 
     def _get_new_unique_id(self) -> str:
         """Return new unique_id format: {mac}_{key}"""
-        return f"{self._device_identifier}_{self.sensor_key}"
+        return self._new_unique_id
 
     @property
     def unique_id(self):
@@ -100,18 +108,8 @@ class MgppBinarySensor(NavienBaseEntity, BinarySensorEntity):
         )
         return self._cached_unique_id
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return the class of this entity."""
-        return self._device_class
-
     @property
     def is_on(self):
         """Return the state of the sensor."""
-        # MGPP typically uses 1=off, 2=on for status flags
-        return self.device.channel_status.get(self.sensor_key, 0) == 2
-
-    @property
-    def entity_registry_enabled_default(self):
-        """Return if the entity should be enabled by default."""
-        return self._enabled_default
+        # Flags are decoded to booleans by MgppDevice when status arrives
+        return self._is_on_getter(self.device)
@@ -4,6 +4,7 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import DOMAIN
 from .navien_api import NavilinkAccountCoordinator
 
@@ -47,7 +48,8 @@ class NavienConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             coordinator = NavilinkAccountCoordinator(
                 userId=user_input['username'],
                 passwd=user_input['password'],
-                polling_interval=0  # 0 means just login, don't start polling
+                polling_interval=0,  # 0 means just login, don't start polling
+                session=async_get_clientsession(self.hass),
             )
             device_list = await coordinator.login()
             if not device_list:
@@ -75,23 +77,20 @@ class NavienConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Use username as unique identifier for the account
         unique_id = f'navien_{self.username}'
-        await self.async_set_unique_id(unique_id)
+        existing_entry = await self.async_set_unique_id(unique_id)
         
-        # Check if entry with this unique_id already exists
-        existing_entry = self._async_current_entries()
-        for entry in existing_entry:
-            if entry.unique_id == unique_id:
-                # Update existing entry
-                self.hass.config_entries.async_update_entry(
-                    entry,
-                    data={
-                        "username": self.username,
-                        "password": self.password,
-                        "polling_interval": user_input["polling_interval"]
-                    }
-                )
-                await self.hass.config_entries.async_reload(entry.entry_id)
-                return self.async_abort(reason="reauth_successful")
+        if existing_entry is not None:
+            # Update existing entry
+            self.hass.config_entries.async_update_entry(
+                existing_entry,
+                data={
+                    "username": self.username,
+                    "password": self.password,
+                    "polling_interval": user_input["polling_interval"]
+                }
+            )
+            await self.hass.config_entries.async_reload(existing_entry.entry_id)
+            return self.async_abort(reason="reauth_successful")
         
         # Create new entry
         return self.async_create_entry(
@@ -1,8 +1,24 @@
 """Base entity for Navien Water Heater integration."""
+from functools import lru_cache
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from .const import DOMAIN
 
 
+# Fields common to every Navien device; copied and completed per device
+_DEVICE_INFO_TEMPLATE = DeviceInfo(manufacturer="Navien")
+
+
+@lru_cache(maxsize=None)
+def _get_device_info(device_identifier: str, name: str) -> DeviceInfo:
+    """Return the DeviceInfo for a device, shared by all of its entities."""
+    device_info = _DEVICE_INFO_TEMPLATE.copy()
+    device_info["identifiers"] = frozenset({(DOMAIN, device_identifier)})
+    device_info["name"] = name
+    return device_info
+
+
 class NavienBaseEntity(Entity):
     """Base class for Navien entities.
     
@@ -11,6 +27,7 @@ class NavienBaseEntity(Entity):
     """
 
     _attr_has_entity_name = True
+    _attr_should_poll = False  # Updates are pushed by the coordinator
 
     def __init__(self, coordinator, device_identifier) -> None:
         """Initialize the base entity.
@@ -21,11 +38,14 @@ class NavienBaseEntity(Entity):
         """
         self._coordinator = coordinator
         self._device_identifier = device_identifier
+        # Bind once so registration and deregistration pass the identical object
+        self._update_callback = self._handle_coordinator_update
+        self._last_state_key = None
         device = coordinator.get_device(device_identifier)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_identifier)},
-            manufacturer="Navien",
-            name=device.device_name if device else "Unknown",
+        self._attr_available = device is not None and device.is_available()
+        self._attr_device_info = _get_device_info(
+            device_identifier,
+            device.device_name if device else "Unknown",
         )
 
     @property
@@ -37,26 +57,54 @@ class NavienBaseEntity(Entity):
         """
         return self._coordinator.get_device(self._device_identifier)
 
-    @property
-    def available(self) -> bool:
-        """Return if the device is online or not."""
-        device = self.device
-        return device is not None and device.is_available()
-
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
         self._coordinator.register_update_callback(
             self._device_identifier,
-            self._handle_coordinator_update
+            self._update_callback
         )
+        # HA writes the initial state once this returns; record it so the first
+        # coordinator update does not write the same state a second time
+        device = self.device
+        self._attr_available = device is not None and device.is_available()
+        self._last_state_key = self._state_key()
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
         self._coordinator.deregister_update_callback(
             self._device_identifier,
-            self._handle_coordinator_update
+            self._update_callback
         )
 
+    def _state_key(self):
+        """Return a value identifying the entity's published state.
+        
+        Subclasses whose state is cheap to snapshot override this so updates
+        that leave it unchanged skip the state write. None means always write.
+        """
+        return None
+
+    @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator.
+        
+        Always invoked on the event loop: MQTT handlers hop onto the loop
+        before devices publish updates. Devices publish whenever their
+        availability changes, so the cached availability is refreshed here.
+        """
+        device = self.device
+        self._attr_available = device is not None and device.is_available()
+        key = self._state_key()
+        if key is not None:
+            if key == self._last_state_key:
+                return
+            self._last_state_key = key
         self.async_write_ha_state()
+
+
+class NavienOnOffEntity(NavienBaseEntity):
+    """Base class for Navien entities whose state is a single is_on flag."""
+
+    def _state_key(self):
+        """Return availability and on/off state for change detection."""
+        return (self.available, self.is_on)
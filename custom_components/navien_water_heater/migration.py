@@ -2,9 +2,13 @@
 import logging
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data key for resolved unique_ids; survives config entry reloads
+_RESOLVED_UNIQUE_IDS = f"{DOMAIN}_resolved_unique_ids"
+
 
 def get_legacy_unique_id_if_exists(
     hass: HomeAssistant,
@@ -16,7 +20,8 @@ def get_legacy_unique_id_if_exists(
     
     This enables backward compatibility when unique_id formats change. If an entity
     was previously registered with the old format, we continue using it to preserve
-    entity_id, history, and automation references.
+    entity_id, history, and automation references. The result is cached in
+    hass.data so config entry reloads do not repeat the registry lookup.
     
     Args:
         hass: Home Assistant instance
@@ -27,14 +32,95 @@ def get_legacy_unique_id_if_exists(
     Returns:
         The legacy_unique_id if an entity with that ID exists, otherwise new_unique_id
     """
-    registry = er.async_get(hass)
+    resolved = hass.data.setdefault(_RESOLVED_UNIQUE_IDS, {})
+    unique_id = _resolve_unique_id(er.async_get(hass), resolved, domain, legacy_unique_id, new_unique_id)
+    if unique_id != new_unique_id:
+        _LOGGER.debug("Using legacy unique_id %s (entity exists in registry)", legacy_unique_id)
+    return unique_id
+
+
+def get_legacy_unique_ids_bulk(
+    hass: HomeAssistant,
+    registry: er.EntityRegistry,
+    domain: str,
+    pairs: list[tuple[str, str]],
+) -> list[str]:
+    """Resolve many (legacy_unique_id, new_unique_id) pairs against one registry.
     
-    # Check if an entity with the legacy unique_id exists
-    if registry.async_get_entity_id(domain, "navien_water_heater", legacy_unique_id):
-        _LOGGER.debug(
-            "Using legacy unique_id %s (entity exists in registry)",
-            legacy_unique_id
+    Args:
+        hass: Home Assistant instance
+        registry: Entity registry, looked up once by the caller
+        domain: Entity domain (e.g., "sensor", "switch", "water_heater")
+        pairs: (legacy_unique_id, new_unique_id) tuples to resolve
+        
+    Returns:
+        The resolved unique_id for each pair, in the same order
+    """
+    resolved = hass.data.setdefault(_RESOLVED_UNIQUE_IDS, {})
+    unique_ids = [
+        _resolve_unique_id(registry, resolved, domain, legacy_unique_id, new_unique_id)
+        for legacy_unique_id, new_unique_id in pairs
+    ]
+    # One summary line per platform instead of one per entity; counting is
+    # skipped entirely unless debug logging is enabled
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        legacy_count = sum(
+            unique_id != new_unique_id
+            for unique_id, (_, new_unique_id) in zip(unique_ids, pairs)
         )
-        return legacy_unique_id
+        if legacy_count:
+            _LOGGER.debug("Using %s legacy %s unique_ids (entities exist in registry)", legacy_count, domain)
+    return unique_ids
+
+
+def prime_unique_ids(
+    hass: HomeAssistant,
+    registry: er.EntityRegistry,
+    domain: str,
+    entities: list,
+) -> None:
+    """Resolve and cache the unique_id of every entity before it is added.
+    
+    Platforms call this once at setup so the registry is consulted in a
+    single pass instead of lazily from each entity's unique_id property.
     
-    return new_unique_id
+    Args:
+        hass: Home Assistant instance
+        registry: Entity registry, looked up once by the caller
+        domain: Entity domain (e.g., "sensor", "switch", "water_heater")
+        entities: Entities exposing _get_legacy_unique_id/_get_new_unique_id
+    """
+    unique_ids = get_legacy_unique_ids_bulk(
+        hass,
+        registry,
+        domain,
+        [
+            (entity._get_legacy_unique_id(), entity._get_new_unique_id())
+            for entity in entities
+        ],
+    )
+    for entity, unique_id in zip(entities, unique_ids):
+        entity._cached_unique_id = unique_id
+
+
+def _resolve_unique_id(
+    registry: er.EntityRegistry,
+    resolved: dict,
+    domain: str,
+    legacy_unique_id: str,
+    new_unique_id: str,
+) -> str:
+    """Resolve a single pair against the registry, memoizing the result in resolved."""
+    key = (domain, legacy_unique_id, new_unique_id)
+    if (unique_id := resolved.get(key)) is not None:
+        return unique_id
+
+    # Check if an entity with the legacy unique_id exists
+    if registry.async_get_entity_id(domain, DOMAIN, legacy_unique_id):
+        unique_id = legacy_unique_id
+    else:
+        unique_id = new_unique_id
+
+    # Cache misses too, so the registry is consulted once per entity per process
+    resolved[key] = unique_id
+    return unique_id
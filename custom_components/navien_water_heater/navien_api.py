@@ -1,15 +1,50 @@
 import asyncio
+import concurrent.futures
 import enum
+import functools
 import json
 import logging
-import uuid
-from datetime import datetime, timedelta
+import secrets
+import threading
+import time
+from dataclasses import dataclass
 import AWSIoTPythonSDK.MQTTLib as mqtt
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # orjson ships with Home Assistant, but keep the API usable without it
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _json_dumps(obj) -> str:
+    """Serialize an outbound MQTT message compactly."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _json_loads(data):
+    """Parse an inbound MQTT payload, which the SDK delivers as bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_pretty(obj) -> str:
+    """Format a payload for debug logging."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Precomputed decodes for the common non-negative integer wire range
+_HALF_DEGREE_CELSIUS = tuple(raw / 2.0 for raw in range(256))
+_TENTH_DEGREE_CELSIUS = tuple(raw / 10.0 for raw in range(1001))
+
+
 # Temperature conversion helpers
 def _decode_half_degree_celsius(raw: int | float) -> float:
     """Decode half-degree Celsius encoding to actual Celsius.
@@ -17,10 +52,13 @@ def _decode_half_degree_celsius(raw: int | float) -> float:
     Used by MGPP display temps and Legacy Celsius devices.
     Wire encoding: raw = °C × 2
     """
-    try:
-        return float(raw) / 2.0
-    except (TypeError, ValueError):
-        return 0.0
+    if type(raw) is int and 0 <= raw < 256:
+        return _HALF_DEGREE_CELSIUS[raw]
+    if isinstance(raw, (int, float)):
+        # Exact for half-degree quantization
+        return raw * 0.5
+    # Missing or malformed field
+    return 0.0
 
 
 def _decode_tenth_degree_celsius(raw: int | float) -> float:
@@ -29,10 +67,22 @@ def _decode_tenth_degree_celsius(raw: int | float) -> float:
     Used by MGPP diagnostic/sensor temperatures.
     Wire encoding: raw = °C × 10
     """
-    try:
-        return float(raw) / 10.0
-    except (TypeError, ValueError):
-        return 0.0
+    if type(raw) is int and 0 <= raw <= 1000:
+        return _TENTH_DEGREE_CELSIUS[raw]
+    if isinstance(raw, (int, float)):
+        # Division, not * 0.1, so e.g. 235 decodes to exactly 23.5
+        return raw / 10.0
+    # Missing or malformed field
+    return 0.0
+
+
+def _with_session_id(payload_json: str, session_id: str) -> str:
+    """Fill in the sessionID of a payload serialized with an empty one.
+    
+    Every message ends with "sessionID": "", which compact encoding renders as
+    '"sessionID":""}', so the id is spliced in before the closing quote.
+    """
+    return f'{payload_json[:-3]}"{session_id}"}}'
 
 
 def _encode_half_degree_celsius(celsius: float) -> int:
@@ -48,12 +98,15 @@ class NavilinkAccountCoordinator:
 
     # The Navien server.
     NAVIEN_WEB_SERVER = "https://nlus.naviensmartcontrol.com/api/v2"
+    # Bounds each REST call so a stalled server fails start() instead of hanging it
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
 
     # Account-level reconnection settings
     MAX_ACCOUNT_RECONNECT_BACKOFF = 300  # 5 minutes maximum backoff
     INITIAL_RECONNECT_BACKOFF = 15  # Start with 15 seconds
 
-    def __init__(self, userId, passwd, polling_interval=15, aws_cert_path="AmazonRootCA1.pem"):
+    def __init__(self, userId, passwd, polling_interval=15, aws_cert_path="AmazonRootCA1.pem",
+                 session=None):
         """
         Construct a new 'NavilinkAccountCoordinator' object.
 
@@ -61,6 +114,8 @@ class NavilinkAccountCoordinator:
         :param passwd: The corresponding user's password
         :param polling_interval: How often to poll for updates
         :param aws_cert_path: Path to AWS IoT certificate
+        :param session: Shared aiohttp.ClientSession; one is created (and closed
+            on disconnect) by the coordinator when omitted
         """
         _LOGGER.debug("Initializing NaviLink account coordinator")
         self.userId = userId
@@ -73,16 +128,52 @@ class NavilinkAccountCoordinator:
         self._disabled_devices = set()  # Set of device identifiers that should not be polled
         self._account_reconnect_attempts = 0
         self._reconnecting = False
-        self._update_callbacks = {}  # device_identifier -> list of callbacks
+        self._update_callbacks = {}  # device_identifier -> set of callbacks
+        self._devices_by_type = None  # device class -> {device_identifier: device}, built lazily
+        self._devices = None  # device_id -> device across gateways, built lazily
+        self._devices_by_identifier = None  # device_identifier -> device, built lazily
+        self._session = session
+        self._owns_session = session is None
 
     @property
     def devices(self):
-        """Get all devices across all gateways."""
-        all_devices = {}
-        for gateway in self.gateways.values():
-            for device_id, device in gateway.devices.items():
-                all_devices[device_id] = device
-        return all_devices
+        """Get all devices across all gateways.
+        
+        Cached until invalidate_devices() is called; callers must not mutate it.
+        """
+        if self._devices is None:
+            all_devices = {}
+            for gateway in self.gateways.values():
+                for device_id, device in gateway.devices.items():
+                    all_devices[device_id] = device
+            self._devices = all_devices
+        return self._devices
+
+    def devices_of(self, device_class):
+        """Get all devices of the given class across all gateways.
+        
+        The per-class index is built on first use and reset whenever the set
+        of gateways or devices changes, so platform setup needs no isinstance filtering.
+        
+        Args:
+            device_class: The device class to select (e.g. MgppDevice)
+            
+        Returns:
+            An iterable of matching device objects
+        """
+        if self._devices_by_type is None:
+            devices_by_type = {}
+            for gateway in self.gateways.values():
+                for device in gateway.devices.values():
+                    devices_by_type.setdefault(type(device), {})[device.device_identifier] = device
+            self._devices_by_type = devices_by_type
+        return self._devices_by_type.get(device_class, {}).values()
+
+    def invalidate_devices(self):
+        """Reset the cached device views after gateways or devices change."""
+        self._devices_by_type = None
+        self._devices = None
+        self._devices_by_identifier = None
 
     def get_device(self, device_identifier):
         """Get a device by its unique identifier.
@@ -93,11 +184,13 @@ class NavilinkAccountCoordinator:
         Returns:
             The device object, or None if not found
         """
-        for gateway in self.gateways.values():
-            for device in gateway.devices.values():
-                if device.device_identifier == device_identifier:
-                    return device
-        return None
+        if self._devices_by_identifier is None:
+            self._devices_by_identifier = {
+                device.device_identifier: device
+                for gateway in self.gateways.values()
+                for device in gateway.devices.values()
+            }
+        return self._devices_by_identifier.get(device_identifier)
 
     def register_update_callback(self, device_identifier, callback):
         """Register a callback for device updates.
@@ -106,9 +199,12 @@ class NavilinkAccountCoordinator:
             device_identifier: The unique identifier for the device
             callback: The callback function to call on updates
         """
-        if device_identifier not in self._update_callbacks:
-            self._update_callbacks[device_identifier] = []
-        self._update_callbacks[device_identifier].append(callback)
+        # Only the first entity of a device allocates its set; setdefault would
+        # build a throwaway set for every registration
+        callbacks = self._update_callbacks.get(device_identifier)
+        if callbacks is None:
+            callbacks = self._update_callbacks[device_identifier] = set()
+        callbacks.add(callback)
 
     def deregister_update_callback(self, device_identifier, callback):
         """Deregister a callback for device updates.
@@ -117,11 +213,12 @@ class NavilinkAccountCoordinator:
             device_identifier: The unique identifier for the device
             callback: The callback function to remove
         """
-        if device_identifier in self._update_callbacks:
-            try:
-                self._update_callbacks[device_identifier].remove(callback)
-            except ValueError:
-                pass
+        callbacks = self._update_callbacks.get(device_identifier)
+        if callbacks is not None:
+            callbacks.discard(callback)
+            # Drop the entry once the last entity for the device is removed
+            if not callbacks:
+                del self._update_callbacks[device_identifier]
 
     def publish_device_update(self, device_identifier):
         """Notify entities that a device has updated.
@@ -129,49 +226,80 @@ class NavilinkAccountCoordinator:
         Args:
             device_identifier: The unique identifier for the device that updated
         """
-        for callback in self._update_callbacks.get(device_identifier, []):
+        for callback in self._update_callbacks.get(device_identifier, ()):
             callback()
 
+    def _get_session(self):
+        """Return the HTTP session, creating an owned one on first use.
+        
+        Login and the device list share the session's connection pool, so the
+        second request reuses the first one's TLS connection.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    async def _close_session(self):
+        """Close the HTTP session if the coordinator created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(self, path, error_message, **kwargs):
+        """POST to the REST API and return the decoded JSON response.
+        
+        Timeouts and connection errors are raised as UnableToConnect, like
+        unexpected response statuses.
+        """
+        try:
+            async with self._get_session().post(
+                NavilinkAccountCoordinator.NAVIEN_WEB_SERVER + path,
+                timeout=self.REQUEST_TIMEOUT,
+                **kwargs
+            ) as response:
+                if response.status != 200:
+                    raise UnableToConnect(error_message)
+                return await response.json()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise UnableToConnect(f"{error_message}: {e}") from e
+
     async def login(self):
         """
         Login to the REST API and get device list.
         Returns list of device info for validation purposes.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                NavilinkAccountCoordinator.NAVIEN_WEB_SERVER + "/user/sign-in",
-                json={"userId": self.userId, "password": self.passwd}
-            ) as response:
-                if response.status != 200:
-                    raise UnableToConnect("Unexpected response during login")
-                response_data = await response.json()
-                if response_data.get('msg', '') == "USER_NOT_FOUND":
-                    raise UserNotFound("Unable to log in with given credentials")
-                try:
-                    self.user_info = response_data["data"]
-                except KeyError:
-                    raise NoResponseData("Unexpected problem while retrieving user data")
+        response_data = await self._post(
+            "/user/sign-in",
+            "Unexpected response during login",
+            json={"userId": self.userId, "password": self.passwd}
+        )
+        if response_data.get('msg', '') == "USER_NOT_FOUND":
+            raise UserNotFound("Unable to log in with given credentials")
+        try:
+            self.user_info = response_data["data"]
+        except KeyError:
+            raise NoResponseData("Unexpected problem while retrieving user data")
 
-                return await self._get_device_list()
+        return await self._get_device_list()
 
     async def _get_device_list(self):
         """Get list of devices for the given user credentials."""
+        # Passed per request: the session may be shared with other integrations
         headers = {"Authorization": self.user_info.get("token", {}).get("accessToken", "")}
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.post(
-                NavilinkAccountCoordinator.NAVIEN_WEB_SERVER + "/device/list",
-                json={"offset": 0, "count": 20, "userId": self.userId}
-            ) as response:
-                if response.status != 200:
-                    raise UnableToConnect("Unexpected response while retrieving device list")
-                response_data = await response.json()
-                try:
-                    self.device_info_list = response_data["data"]
-                    _LOGGER.debug(f"Response data: {response_data}")
-                except KeyError:
-                    raise NoResponseData("Unexpected problem while retrieving device list")
+        response_data = await self._post(
+            "/device/list",
+            "Unexpected response while retrieving device list",
+            json={"offset": 0, "count": 20, "userId": self.userId},
+            headers=headers,
+        )
+        try:
+            self.device_info_list = response_data["data"]
+            _LOGGER.debug("Response data: %s", response_data)
+        except KeyError:
+            raise NoResponseData("Unexpected problem while retrieving device list")
 
-                return self.device_info_list
+        return self.device_info_list
 
     async def start(self):
         """Start the coordinator and all gateway connections."""
@@ -191,6 +319,7 @@ class NavilinkAccountCoordinator:
                 raise NoNavienDevices("No Navien devices found with the given credentials")
 
             # Create a NavilinkConnect for each gateway
+            new_gateways = {}
             for device_info in self.device_info_list:
                 mac_address = device_info.get("deviceInfo", {}).get("macAddress", "")
                 if mac_address and mac_address not in self.gateways:
@@ -203,18 +332,40 @@ class NavilinkAccountCoordinator:
                         coordinator=self
                     )
                     self.gateways[mac_address] = gateway
-                    _LOGGER.debug(f"Coordinator: starting gateway {mac_address}")
-                    result = await gateway.start()
-                    _LOGGER.debug(f"Coordinator: gateway {mac_address} start returned {result is not None}")
-                    
-                    # If gateway returned None, it triggered account-level reconnection
-                    # Stop processing and let the reconnection handle it
-                    if result is None:
-                        _LOGGER.debug(
-                            f"Gateway {mac_address} triggered account-level reconnection, "
-                            f"stopping coordinator start"
-                        )
-                        return None
+                    new_gateways[mac_address] = gateway
+            self.invalidate_devices()
+
+            # Connect the gateways concurrently so startup takes the slowest
+            # handshake rather than the sum of them
+            _LOGGER.debug(f"Coordinator: starting {len(new_gateways)} gateways")
+            results = await asyncio.gather(
+                *(gateway.start() for gateway in new_gateways.values()),
+                return_exceptions=True,
+            )
+            for mac_address, result in zip(new_gateways, results):
+                _LOGGER.debug(f"Coordinator: gateway {mac_address} start returned {result is not None}")
+            failures = [result for result in results if isinstance(result, BaseException)]
+            if failures:
+                # Stop the gateways that did start so a retry does not run a second set
+                started = [
+                    gateway for gateway, result in zip(new_gateways.values(), results)
+                    if not isinstance(result, BaseException)
+                ]
+                await asyncio.gather(*(gateway.disconnect() for gateway in started), return_exceptions=True)
+                for mac_address in new_gateways:
+                    self.gateways.pop(mac_address, None)
+                self.invalidate_devices()
+                raise failures[0]
+
+            # If a gateway returned None, it triggered account-level reconnection
+            # Stop processing and let the reconnection handle it
+            for mac_address, result in zip(new_gateways, results):
+                if result is None:
+                    _LOGGER.debug(
+                        f"Gateway {mac_address} triggered account-level reconnection, "
+                        f"stopping coordinator start"
+                    )
+                    return None
 
             if not self.devices:
                 raise NoNavienDevices("No Navien devices found with the given credentials")
@@ -228,11 +379,18 @@ class NavilinkAccountCoordinator:
     async def disconnect(self):
         """Disconnect all gateways and clean up state."""
         _LOGGER.debug(f"Disconnecting {len(self.gateways)} gateways")
-        for mac_address, gateway in self.gateways.items():
-            _LOGGER.debug(f"Disconnecting gateway {mac_address}")
-            await gateway.disconnect()
-            _LOGGER.debug(f"Gateway {mac_address} disconnected")
+        results = await asyncio.gather(
+            *(gateway.disconnect() for gateway in self.gateways.values()),
+            return_exceptions=True,
+        )
+        for mac_address, result in zip(self.gateways, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(f"Error disconnecting gateway {mac_address}: {result}")
+            else:
+                _LOGGER.debug(f"Gateway {mac_address} disconnected")
         self.gateways.clear()
+        self.invalidate_devices()
+        await self._close_session()
         _LOGGER.debug("All gateways disconnected and cleared")
 
     def is_device_polling_disabled(self, device_identifier):
@@ -253,12 +411,17 @@ class NavilinkAccountCoordinator:
             device_identifier: The unique identifier for the device
             disabled: True to disable polling, False to enable polling
         """
+        if disabled == (device_identifier in self._disabled_devices):
+            return
         if disabled:
             self._disabled_devices.add(device_identifier)
-            _LOGGER.debug(f"Disabled polling for device: {device_identifier}")
+            _LOGGER.debug("Disabled polling for device: %s", device_identifier)
         else:
             self._disabled_devices.discard(device_identifier)
-            _LOGGER.debug(f"Enabled polling for device: {device_identifier}")
+            _LOGGER.debug("Enabled polling for device: %s", device_identifier)
+        # Only the gateway that owns the device needs to rebuild its enabled list
+        if (device := self.get_device(device_identifier)) is not None and device.gateway:
+            device.gateway.invalidate_enabled_devices()
 
     def set_disabled_devices(self, device_identifiers):
         """Set the complete set of devices that should not be polled.
@@ -267,7 +430,13 @@ class NavilinkAccountCoordinator:
             device_identifiers: Set or list of device identifiers to disable polling for
         """
         self._disabled_devices = set(device_identifiers)
-        _LOGGER.debug(f"Updated disabled devices: {self._disabled_devices}")
+        _LOGGER.debug("Updated disabled devices: %s", self._disabled_devices)
+        self._invalidate_enabled_devices()
+
+    def _invalidate_enabled_devices(self):
+        """Make every gateway recompute its enabled devices after the disabled set changes."""
+        for gateway in self.gateways.values():
+            gateway.invalidate_enabled_devices()
 
     def gateway_reconnect_failed(self, gateway):
         """Called by a gateway when it has exceeded its reconnection attempts.
@@ -355,6 +524,13 @@ class NavilinkConnect:
     
     # Gateway reconnection limit
     MAX_GATEWAY_RECONNECT_ATTEMPTS = 3
+    
+    # Status queries are idempotent and answered in-band, so skip the PUBACK wait
+    # for them; control commands keep the default QoS 1
+    STATUS_REQUEST_QOS = 0
+
+    # Seconds to wait for the SUBACKs of a subscription batch (SDK operation default)
+    SUBACK_TIMEOUT = 5
 
     def __init__(self, user_info, device_info, polling_interval=15, aws_cert_path="AmazonRootCA1.pem", 
                  subscribe_all_topics=False, coordinator=None):
@@ -382,40 +558,63 @@ class NavilinkConnect:
         self.topics = None
         self.messages = None
         self.devices = {}  # Renamed from channels
+        self._enabled_devices = None  # Devices not disabled for polling, built lazily
         self.disconnect_event = asyncio.Event()
-        self.response_events = {}
+        self._poll_wakeup = asyncio.Event()  # Set to poll ahead of the next deadline
+        self.response_futures = {}  # Session ID -> future resolved with the parsed response
+        self._inflight_refresh = None  # Post-command status refresh awaiting its response
+        self._inflight_refresh_channel = None  # Legacy channel it covers; None covers every device
+        self._last_session_id = 0
         self.client_lock = asyncio.Lock()
         self.connection_lock = asyncio.Lock()  # Prevents concurrent connection attempts
+        # Monotonic loop.time() seconds, immune to wall-clock jumps
         self.last_poll = None
         self.last_data_received = None
         self.consecutive_poll_failures = 0
         self.reconnect_attempts = 0
-        self.device_type = int(self.device_info.get("deviceInfo", {}).get("deviceType", 1))
+        # deviceInfo is fixed for the gateway's lifetime, so parse it once
+        gateway_info = self.device_info.get("deviceInfo", {})
+        self.device_type = int(gateway_info.get("deviceType", 1))
+        self.mac_address = gateway_info.get("macAddress", "")
+        self.device_name = gateway_info.get("deviceName", "Unknown")
+        # Currently, only device type 52 (NWP500) uses the MGPP protocol
+        self._is_mgpp = self.device_type == 52
+        # Blocking MQTT client calls run on one dedicated thread, so they stay
+        # in order and never queue behind Home Assistant's shared executor
+        self._mqtt_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"navien-mqtt-{self.mac_address}"
+        )
 
-    @property
-    def is_mgpp(self) -> bool:
-        """Public flag indicating if this device uses the MGPP protocol."""
-        try:
-            return self._uses_mgpp_protocol()
-        except Exception:
-            return False
+    def _run_mqtt(self, func, *args):
+        """Run a blocking MQTT client call on this gateway's MQTT thread.
+        
+        Resolves the running loop per call; self.loop is only needed by SDK
+        threads, which must hand work back with call_soon_threadsafe.
+        """
+        return asyncio.get_running_loop().run_in_executor(self._mqtt_executor, func, *args)
 
     @property
-    def mac_address(self):
-        """Get the MAC address of this gateway."""
-        return self.device_info.get("deviceInfo", {}).get("macAddress", "")
+    def enabled_devices(self):
+        """Devices on this gateway whose polling is not disabled.
+        
+        Cached until the devices or the coordinator's disabled set change.
+        """
+        if self._enabled_devices is None:
+            coordinator = self.coordinator
+            self._enabled_devices = [
+                device for device in self.devices.values()
+                if not (coordinator and coordinator.is_device_polling_disabled(device.device_identifier))
+            ]
+        return self._enabled_devices
 
-    @property
-    def device_name(self):
-        """Get the device name of this gateway."""
-        return self.device_info.get("deviceInfo", {}).get("deviceName", "Unknown")
+    def invalidate_enabled_devices(self):
+        """Reset the enabled device list after devices or the disabled set change."""
+        self._enabled_devices = None
 
-    def _uses_mgpp_protocol(self):
-        """
-        Determine if the device uses the MGPP protocol.
-        Currently, only device type 52 (NWP500) uses MGPP protocol.
-        """
-        return self.device_type == 52
+    @property
+    def is_mgpp(self) -> bool:
+        """Public flag indicating if this device uses the MGPP protocol."""
+        return self._is_mgpp
 
     async def start(self):
         """Start the gateway connection."""
@@ -517,8 +716,9 @@ class NavilinkConnect:
             _LOGGER.debug("Stopping existing MQTT client before creating new connection")
             await self._stop_mqtt_client()
         
-        self.client_id = str(uuid.uuid4())
-        if self._uses_mgpp_protocol():
+        self.client_id = secrets.token_hex(16)
+        # Built once per connection and shared by every channel on this gateway
+        if self._is_mgpp:
             self.topics = MgppTopics(self.user_info, self.device_info, self.client_id)
             self.messages = MgppMessages(self.device_info, self.client_id, self.topics)
         else:
@@ -544,26 +744,27 @@ class NavilinkConnect:
             self.client.configureUsernamePassword(username='?SDK=Android&Version=2.16.12', password=None)
             self.client.configureLastWill(
                 topic=self.topics.app_connection(),
-                payload=json.dumps(self.messages.last_will(), separators=(',', ':')),
+                payload=_json_dumps(self.messages.last_will()),
                 QoS=1, retain=False
             )
-            await self.loop.run_in_executor(None, self.client.configureCredentials, self.aws_cert_path)
+            # The SDK only accepts a CA path and opens it on every client, so there are
+            # no cert bytes to share across gateways; keep the open off the event loop.
+            await self._run_mqtt(self.client.configureCredentials, self.aws_cert_path)
             self.client.configureIAMCredentials(
                 AWSAccessKeyID=accessKeyId, AWSSecretAccessKey=secretKey, AWSSessionToken=sessionToken
             )
             self.client.configureConnectDisconnectTimeout(5)
             self.client.onOffline = self._on_offline
             self.client.onOnline = self._on_online
-            await self.loop.run_in_executor(None, self.client.connect)
+            await self._run_mqtt(self.client.connect)
             await self._subscribe_to_topics()
             if not len(self.devices):
-                if self._uses_mgpp_protocol():
+                if self._is_mgpp:
                     await self._get_mgpp_device_info()
                 else:
                     await self._get_device_info()
             await self._get_device_status_all(wait_for_response=True)
-            self.last_poll = datetime.now()
-            self.last_data_received = datetime.now()
+            self.last_poll = self.last_data_received = self.loop.time()
             self.consecutive_poll_failures = 0
             # Note: reconnect_attempts is NOT reset here - only after the connection
             # proves stable through successful polling. This prevents infinite
@@ -573,25 +774,29 @@ class NavilinkConnect:
             raise NoAccessKey("Missing Access key, Secret key, or Session token")
 
     async def _poll_mqtt_server(self):
-        time_delta = 0
+        # Polls are pinned to absolute loop-time deadlines so the cadence does
+        # not drift by the duration of each poll
+        self._poll_wakeup.clear()
+        next_poll = self.loop.time() + self.polling_interval
         while self.connected and not self.shutting_down:
-            if time_delta < self.polling_interval:
-                interval = self.polling_interval - time_delta
-            else:
-                interval = 0.1
-            await asyncio.sleep(interval)
+            try:
+                await asyncio.wait_for(
+                    self._poll_wakeup.wait(),
+                    timeout=max(next_poll - self.loop.time(), 0.1)
+                )
+                woken = True
+            except asyncio.TimeoutError:
+                woken = False
+            self._poll_wakeup.clear()
+            poll_started = self.loop.time()
 
             if self._is_connection_stale():
                 _LOGGER.warning("Connection appears stale - no data received recently, triggering reconnection")
                 raise StaleConnectionError("No data received within staleness timeout")
 
-            pre_poll = datetime.now()
             if not self.client_lock.locked():
                 # Check if all devices are disabled - skip polling entirely
-                all_disabled = all(
-                    self.coordinator and self.coordinator.is_device_polling_disabled(device.device_identifier)
-                    for device in self.devices.values()
-                ) if self.devices else False
+                all_disabled = bool(self.devices) and not self.enabled_devices
                 
                 if all_disabled:
                     _LOGGER.debug("All devices for this gateway are disabled, skipping poll")
@@ -618,10 +823,17 @@ class NavilinkConnect:
                                 f"Connection stable after {self.reconnect_attempts} reconnection attempts, resetting counter"
                             )
                             self.reconnect_attempts = 0
-                    for device_num, device in self.devices.items():
-                        _LOGGER.debug(f"Device {device_num} status after polling: {device.channel_status}")
-            self.last_poll = datetime.now()
-            time_delta = (self.last_poll - pre_poll).total_seconds()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        for device_num, device in self.devices.items():
+                            _LOGGER.debug("Device %s status after polling: %s", device_num, device.channel_status)
+            self.last_poll = self.loop.time()
+            # An early wake restarts the cadence; a slow poll skips missed slots
+            # instead of polling back to back
+            next_poll = (poll_started if woken else next_poll) + self.polling_interval
+            now = self.loop.time()
+            if next_poll <= now:
+                missed_slots = (now - next_poll) // self.polling_interval + 1
+                next_poll += missed_slots * self.polling_interval
         if not self.shutting_down:
             raise PollingError("Polling of AWS IOT Navilink server completed")
 
@@ -630,13 +842,13 @@ class NavilinkConnect:
         if self.last_data_received is None:
             return False
 
-        staleness_timeout = timedelta(seconds=self.polling_interval * self.STALENESS_TIMEOUT_MULTIPLIER)
-        time_since_data = datetime.now() - self.last_data_received
+        staleness_timeout = self.polling_interval * self.STALENESS_TIMEOUT_MULTIPLIER
+        time_since_data = self.loop.time() - self.last_data_received
 
         if time_since_data > staleness_timeout:
             _LOGGER.debug(
-                f"Data staleness check: last data {time_since_data.total_seconds():.1f}s ago, "
-                f"timeout is {staleness_timeout.total_seconds():.1f}s"
+                "Data staleness check: last data %.1fs ago, timeout is %.1fs",
+                time_since_data, staleness_timeout,
             )
             return True
         return False
@@ -644,13 +856,27 @@ class NavilinkConnect:
     async def _get_device_status_all_with_tracking(self):
         """Poll for device status and track if responses are received."""
         try:
-            await self._get_device_status_all(wait_for_response=True)
+            if (inflight_refresh := self._inflight_refresh) is None:
+                await self._get_device_status_all(wait_for_response=True)
+            else:
+                # A command's refresh is newer than any poll would be, so wait
+                # for its response instead of publishing a duplicate request.
+                # Legacy refreshes cover one channel; the others are still polled.
+                refresh_channel = self._inflight_refresh_channel
+                if refresh_channel is None or all(
+                    device.channel_number == refresh_channel for device in self.enabled_devices
+                ):
+                    _LOGGER.debug("Status refresh already in flight, skipping poll request")
+                else:
+                    _LOGGER.debug("Status refresh in flight for channel %s, polling the others", refresh_channel)
+                    await self._get_device_status_all(wait_for_response=True, skip_channel=refresh_channel)
+                await asyncio.shield(inflight_refresh)
             return True
         except asyncio.TimeoutError:
             _LOGGER.debug("Poll request timed out waiting for response")
             return False
         except Exception as e:
-            _LOGGER.debug(f"Poll request failed: {e}")
+            _LOGGER.debug("Poll request failed: %s", e)
             return False
 
     async def _server_connection_lost(self):
@@ -668,13 +894,12 @@ class NavilinkConnect:
         """
         if self.client:
             try:
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self.client.disconnect)
+                await self._run_mqtt(self.client.disconnect)
                 _LOGGER.debug("MQTT client stopped to prevent SDK auto-reconnect")
             except Exception as e:
                 # Log at debug level since this is expected to sometimes fail
                 # (e.g., if the connection is already fully closed)
-                _LOGGER.debug(f"Error stopping MQTT client (may be expected): {e}")
+                _LOGGER.debug("Error stopping MQTT client (may be expected): %s", e)
             finally:
                 # Clear client reference so a fresh client is created on reconnect
                 self.client = None
@@ -686,8 +911,8 @@ class NavilinkConnect:
             shutting_down: If True, prevents reconnection attempts.
         """
         _LOGGER.debug(
-            f"Gateway disconnect called: shutting_down={shutting_down}, "
-            f"client={self.client is not None}, connected={self.connected}"
+            "Gateway disconnect called: shutting_down=%s, client=%s, connected=%s",
+            shutting_down, self.client is not None, self.connected,
         )
         # Always set shutting_down flag to stop background tasks
         self.shutting_down = shutting_down
@@ -708,94 +933,176 @@ class NavilinkConnect:
         
         if self.client and was_connected:
             try:
-                # Use asyncio.get_running_loop() instead of stored loop reference
-                # to avoid issues with stale loop references
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self.client.disconnect)
+                await self._run_mqtt(self.client.disconnect)
                 _LOGGER.debug("Gateway MQTT client disconnected")
             except Exception as e:
                 _LOGGER.warning(f"Error during MQTT disconnect: {e}")
+        
+        # A gateway that is shutting down is never reconnected, so release its thread
+        if shutting_down:
+            self._mqtt_executor.shutdown(wait=False)
 
     def _on_online(self):
         self.connected = True
+        # Called from the SDK thread; refresh right away after the SDK reconnects
+        self.loop.call_soon_threadsafe(self._poll_wakeup.set)
 
     def _on_offline(self):
         if not self.shutting_down:
             self.disconnect_event.set()
 
-    async def async_subscribe(self, topic, QoS=1, callback=None):
-        _LOGGER.debug("Subscribing to " + topic)
+    async def async_subscribe_many(self, subscriptions, QoS=1):
+        """Subscribe to several topics under one lock acquisition and executor call.
+        
+        Every SUBSCRIBE is sent before any SUBACK is awaited, so the batch costs
+        one broker round trip rather than one per topic.
+        
+        Args:
+            subscriptions: (topic, callback) tuples
+            QoS: MQTT quality of service for every subscription
+        """
+        _LOGGER.debug("Subscribing to %d topics", len(subscriptions))
         try:
             def subscribe():
-                self.client.subscribe(topic=topic, QoS=QoS, callback=callback)
+                acks = []
+                for topic, callback in subscriptions:
+                    _LOGGER.debug("Subscribing to %s", topic)
+                    acked = threading.Event()
+                    self.client.subscribeAsync(
+                        topic, QoS,
+                        ackCallback=lambda mid, data, acked=acked: acked.set(),
+                        messageCallback=callback,
+                    )
+                    acks.append((topic, acked))
+                deadline = time.monotonic() + self.SUBACK_TIMEOUT
+                for topic, acked in acks:
+                    if not acked.wait(max(0, deadline - time.monotonic())):
+                        raise TimeoutError(f"Subscribe to {topic} timed out")
 
             async with self.client_lock:
-                await self.loop.run_in_executor(None, subscribe)
+                await self._run_mqtt(subscribe)
         except Exception as e:
-            _LOGGER.debug(f"Error occurred in async_subscribe: {e}")
+            _LOGGER.debug(f"Error occurred in async_subscribe_many: {e}")
             await self.disconnect(shutting_down=False)
 
     async def async_publish(self, topic, payload, QoS=1, session_id=""):
+        """Publish a message and return the parsed response if one is awaited."""
         try:
+            # Payloads may arrive pre-serialized from the message templates
+            payload_json = payload if isinstance(payload, str) else _json_dumps(payload)
+
             def publish():
-                self.client.publish(topic=topic, payload=json.dumps(payload, separators=(',', ':')), QoS=QoS)
+                self.client.publish(topic=topic, payload=payload_json, QoS=QoS)
 
             async with self.client_lock:
-                await self.loop.run_in_executor(None, publish)
+                await self._run_mqtt(publish)
 
-            if response_event := self.response_events.get(session_id, None):
+            if response_future := self.response_futures.get(session_id, None):
                 try:
-                    await asyncio.wait_for(response_event.wait(), timeout=self.polling_interval)
+                    return await asyncio.wait_for(response_future, timeout=self.polling_interval)
                 except asyncio.TimeoutError:
-                    _LOGGER.debug(f"Timeout waiting for response to session {session_id}")
-                    response_event.clear()
-                    self.response_events.pop(session_id, None)
+                    _LOGGER.debug("Timeout waiting for response to session %s", session_id)
                     raise
                 except Exception as e:
                     _LOGGER.debug(f"Error waiting for response: {e}")
-                    response_event.clear()
-                    self.response_events.pop(session_id, None)
                     raise
-                response_event.clear()
-                self.response_events.pop(session_id, None)
+                finally:
+                    self.response_futures.pop(session_id, None)
         except asyncio.TimeoutError:
             raise
         except Exception as e:
             _LOGGER.debug(f"Error occurred in async_publish: {e}")
-            if response_event := self.response_events.get(session_id, None):
-                response_event.clear()
-                self.response_events.pop(session_id, None)
+            self.response_futures.pop(session_id, None)
             await self.disconnect(shutting_down=False)
 
+    async def async_publish_many(self, requests, QoS=1):
+        """Publish several messages in one executor call and await all responses.
+        
+        Args:
+            requests: (topic, payload, session_id) tuples; an empty session_id
+                means no response is awaited for that message
+            QoS: MQTT quality of service for every message
+        """
+        session_ids = [session_id for _, _, session_id in requests if session_id]
+        try:
+            def publish():
+                for topic, payload, _ in requests:
+                    # Payloads may arrive pre-serialized from the message templates
+                    if not isinstance(payload, str):
+                        payload = _json_dumps(payload)
+                    self.client.publish(topic=topic, payload=payload, QoS=QoS)
+
+            async with self.client_lock:
+                await self._run_mqtt(publish)
+
+            response_futures = [
+                self.response_futures[session_id]
+                for session_id in session_ids
+                if session_id in self.response_futures
+            ]
+            if response_futures:
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(*response_futures),
+                        timeout=self.polling_interval
+                    )
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("Timeout waiting for responses to sessions %s", session_ids)
+                    raise
+                finally:
+                    for session_id in session_ids:
+                        self.response_futures.pop(session_id, None)
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            _LOGGER.debug(f"Error occurred in async_publish_many: {e}")
+            for session_id in session_ids:
+                self.response_futures.pop(session_id, None)
+            await self.disconnect(shutting_down=False)
+
+    def _on_loop(self, handler):
+        """Return an MQTT callback that schedules handler on the event loop."""
+        return functools.partial(self.loop.call_soon_threadsafe, handler)
+
     async def _subscribe_to_topics(self):
-        if self._uses_mgpp_protocol():
-            await self.async_subscribe(topic=self.topics.mgpp_default(), callback=self.handle_other)
-            await self.async_subscribe(topic=self.topics.mgpp_res_did(), callback=self.handle_mgpp_did)
-            await self.async_subscribe(topic=self.topics.mgpp_res(), callback=self.handle_mgpp_status)
-            await self.async_subscribe(topic=self.topics.mgpp_res_rsv_rd(), callback=self.handle_mgpp_rsv)
-            await self.async_subscribe(topic=self.topics.mgpp_ctrl_fail(), callback=self.handle_mgpp_ctrl_fail)
-            await self.async_subscribe(topic=self.topics.app_connection(), callback=self.handle_mgpp_connection)
-            await self.async_subscribe(topic=self.topics.mgpp_connection(), callback=self.handle_mgpp_connection)
-            await self.async_subscribe(topic=self.topics.mgpp_disconnect(), callback=self.handle_mgpp_disconnect)
+        # Topics routed to handle_other are only logged, so they are subscribed
+        # only when subscribe_all_topics asks for the extra traffic
+        if self._is_mgpp:
+            subscriptions = [
+                (self.topics.mgpp_res_did(), self._on_loop(self.async_handle_mgpp_did)),
+                (self.topics.mgpp_res(), self._on_loop(self.async_handle_mgpp_status)),
+                (self.topics.mgpp_res_rsv_rd(), self._on_loop(self.async_handle_mgpp_rsv)),
+                (self.topics.mgpp_ctrl_fail(), self._on_loop(self.async_handle_mgpp_ctrl_fail)),
+                (self.topics.app_connection(), self._on_loop(self.async_handle_mgpp_connection)),
+                (self.topics.mgpp_connection(), self._on_loop(self.async_handle_mgpp_connection)),
+                (self.topics.mgpp_disconnect(), self._on_loop(self.async_handle_mgpp_disconnect)),
+            ]
+            if self.subscribe_all_topics:
+                subscriptions.append((self.topics.mgpp_default(), self.handle_other))
         else:
-            await self.async_subscribe(topic=self.topics.channel_info_sub(), callback=self.handle_other)
-            await self.async_subscribe(topic=self.topics.channel_info_res(), callback=self.handle_device_info)
-            await self.async_subscribe(topic=self.topics.control_fail(), callback=self.handle_other)
-            await self.async_subscribe(topic=self.topics.channel_status_sub(), callback=self.handle_other)
-            await self.async_subscribe(topic=self.topics.channel_status_res(), callback=self.handle_device_status)
-            await self.async_subscribe(topic=self.topics.connection(), callback=self.handle_other)
-            await self.async_subscribe(topic=self.topics.disconnect(), callback=self.handle_other)
+            subscriptions = [
+                (self.topics.channel_info_res(), self._on_loop(self.async_handle_device_info)),
+                (self.topics.channel_status_res(), self._on_loop(self.async_handle_device_status)),
+            ]
             if self.subscribe_all_topics:
-                await self.async_subscribe(topic=self.topics.weekly_schedule_sub(), callback=self.handle_other)
-                await self.async_subscribe(topic=self.topics.weekly_schedule_res(), callback=self.handle_weekly_schedule)
-                await self.async_subscribe(topic=self.topics.simple_trend_sub(), callback=self.handle_other)
-                await self.async_subscribe(topic=self.topics.simple_trend_res(), callback=self.handle_simple_trend)
-                await self.async_subscribe(topic=self.topics.hourly_trend_sub(), callback=self.handle_other)
-                await self.async_subscribe(topic=self.topics.hourly_trend_res(), callback=self.handle_hourly_trend)
-                await self.async_subscribe(topic=self.topics.daily_trend_sub(), callback=self.handle_other)
-                await self.async_subscribe(topic=self.topics.daily_trend_res(), callback=self.handle_daily_trend)
-                await self.async_subscribe(topic=self.topics.monthly_trend_sub(), callback=self.handle_other)
-                await self.async_subscribe(topic=self.topics.monthly_trend_res(), callback=self.handle_monthly_trend)
+                subscriptions.extend([
+                    (self.topics.channel_info_sub(), self.handle_other),
+                    (self.topics.control_fail(), self.handle_other),
+                    (self.topics.channel_status_sub(), self.handle_other),
+                    (self.topics.connection(), self.handle_other),
+                    (self.topics.disconnect(), self.handle_other),
+                    (self.topics.weekly_schedule_sub(), self.handle_other),
+                    (self.topics.weekly_schedule_res(), self.handle_weekly_schedule),
+                    (self.topics.simple_trend_sub(), self.handle_other),
+                    (self.topics.simple_trend_res(), self.handle_simple_trend),
+                    (self.topics.hourly_trend_sub(), self.handle_other),
+                    (self.topics.hourly_trend_res(), self.handle_hourly_trend),
+                    (self.topics.daily_trend_sub(), self.handle_other),
+                    (self.topics.daily_trend_res(), self.handle_daily_trend),
+                    (self.topics.monthly_trend_sub(), self.handle_other),
+                    (self.topics.monthly_trend_res(), self.handle_monthly_trend),
+                ])
+        await self.async_subscribe_many(subscriptions)
 
     async def _get_mgpp_device_info(self):
         """Initialize MGPP device by requesting DID and status information"""
@@ -814,27 +1121,27 @@ class NavilinkConnect:
                 "setupDHWTempMax": 140
             }
             self.devices[1] = MgppDevice(1, channel_info, self, None)
+            self.invalidate_enabled_devices()
+            if self.coordinator:
+                self.coordinator.invalidate_devices()
             _LOGGER.debug("Created MGPP device")
 
         topic = self.topics.mgpp_st_did()
-        payload = self.messages.mgpp_did()
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        payload = self.messages.mgpp_did_json(session_id)
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
 
         topic = self.topics.mgpp_st()
-        payload = self.messages.mgpp_status()
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        payload = self.messages.mgpp_status_json(session_id)
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
 
         topic = self.topics.mgpp_st_rsv_rd()
-        payload = self.messages.mgpp_rsv_rd()
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        payload = self.messages.mgpp_rsv_rd_json(session_id)
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
 
         if len(self.devices) == 0:
@@ -843,82 +1150,114 @@ class NavilinkConnect:
     async def _get_device_info(self):
         """Get channel/device info for legacy devices."""
         topic = self.topics.start()
-        payload = self.messages.channel_info()
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        payload = self.messages.channel_info_json(session_id)
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
         if len(self.devices) == 0:
             raise NoChannelInformation("Unable to get channel information")
 
-    async def _get_device_status_all(self, wait_for_response=False):
-        """Get status for all devices on this gateway."""
-        _LOGGER.debug(f"Getting device status for device type {self.device_type}, wait_for_response={wait_for_response}")
-        if self._uses_mgpp_protocol():
+    async def _get_device_status_all(self, wait_for_response=False, skip_channel=None):
+        """Get status for all devices on this gateway.
+        
+        skip_channel names a legacy channel whose status is already being refreshed.
+        """
+        _LOGGER.debug(
+            "Getting device status for device type %s, wait_for_response=%s", self.device_type, wait_for_response
+        )
+        if self._is_mgpp:
             _LOGGER.debug("Using MGPP protocol for status requests")
             await self._get_mgpp_status_all(wait_for_response)
         else:
             _LOGGER.debug("Using legacy protocol for status requests")
-            for device in self.devices.values():
-                # Skip polling for disabled devices
-                if self.coordinator and self.coordinator.is_device_polling_disabled(device.device_identifier):
-                    _LOGGER.debug(f"Skipping disabled device {device.device_identifier}")
+            requests = []
+            topic = self.topics.channel_status_req()
+            # Disabled devices are already filtered out
+            for device in self.enabled_devices:
+                if device.channel_number == skip_channel:
                     continue
-                    
-                topic = self.topics.channel_status_req()
-                payload = self.messages.channel_status(device.channel_number, device.channel_info.get("unitCount", 1))
                 session_id = self.get_session_id()
-                payload["sessionID"] = session_id
+                payload = self.messages.channel_status_json(
+                    device.channel_number, device.channel_info.get("unitCount", 1), session_id
+                )
                 if wait_for_response:
-                    self.response_events[session_id] = asyncio.Event()
+                    self.response_futures[session_id] = self.loop.create_future()
                 else:
                     session_id = ""
-                await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+                requests.append((topic, payload, session_id))
+            if requests:
+                await self.async_publish_many(requests, QoS=self.STATUS_REQUEST_QOS)
 
-    async def _get_mgpp_status_all(self, wait_for_response=False):
-        """Poll MGPP device for status and RSV data"""
+    async def _get_mgpp_status_all(self, wait_for_response=False, include_status=True):
+        """Poll MGPP device for status and RSV data
+        
+        include_status=False requests only the RSV data, for when the status is already current.
+        """
         _LOGGER.debug("Polling MGPP device for status...")
         
         # Check if MGPP device is disabled
-        for device in self.devices.values():
-            if self.coordinator and self.coordinator.is_device_polling_disabled(device.device_identifier):
-                _LOGGER.debug(f"Skipping disabled MGPP device {device.device_identifier}")
-                return
+        if len(self.enabled_devices) < len(self.devices):
+            _LOGGER.debug("Skipping disabled MGPP device")
+            return
         
-        topic = self.topics.mgpp_st()
-        payload = self.messages.mgpp_status()
-        session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        _LOGGER.debug(f"Publishing status request to {topic} with session {session_id}")
-        if wait_for_response:
-            self.response_events[session_id] = asyncio.Event()
-        else:
-            session_id = ""
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        # Status and RSV go out together and their responses are awaited concurrently
+        requests = []
+        queries = [(self.topics.mgpp_st_rsv_rd(), self.messages.mgpp_rsv_rd_json)]
+        if include_status:
+            queries.insert(0, (self.topics.mgpp_st(), self.messages.mgpp_status_json))
+        for topic, build_payload in queries:
+            session_id = self.get_session_id()
+            payload = build_payload(session_id)
+            _LOGGER.debug("Publishing request to %s with session %s", topic, session_id)
+            if wait_for_response:
+                self.response_futures[session_id] = self.loop.create_future()
+            else:
+                session_id = ""
+            requests.append((topic, payload, session_id))
+        await self.async_publish_many(requests, QoS=self.STATUS_REQUEST_QOS)
 
-        topic = self.topics.mgpp_st_rsv_rd()
-        payload = self.messages.mgpp_rsv_rd()
-        session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        if wait_for_response:
-            self.response_events[session_id] = asyncio.Event()
+    async def _refresh_status_after_command(self, channel_number, response=None):
+        """Request fresh status after a control command, visible to the poll loop.
+        
+        The refresh is published after the command, so the poll loop may join it;
+        the reverse is not safe, as an earlier poll can answer with pre-command state.
+        Commands are not merged ahead of it: an MGPP control frame carries a single
+        command and mode, and each device's command_lock runs overlapping set_* calls
+        one after another, each with its own refresh.
+        MGPP control responses arrive on the status topic; when one carries the
+        post-command status, it has already been applied and only the reservation
+        (RSV) data is re-read.
+        """
+        if self._is_mgpp:
+            status_applied = response is not None and "status" in response.get("response", {})
+            refresh = self._get_mgpp_status_all(wait_for_response=True, include_status=not status_applied)
+            refresh_channel = None
         else:
-            session_id = ""
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+            refresh = self._get_device_status(channel_number)
+            refresh_channel = channel_number
+        inflight_refresh = self._inflight_refresh = asyncio.ensure_future(refresh)
+        self._inflight_refresh_channel = refresh_channel
+        try:
+            await inflight_refresh
+        finally:
+            if self._inflight_refresh is inflight_refresh:
+                self._inflight_refresh = None
+                self._inflight_refresh_channel = None
 
     async def _get_device_status(self, channel_number):
         """Get status for a specific device."""
         device = self.devices.get(channel_number, {})
         topic = self.topics.channel_status_req()
-        payload = self.messages.channel_status(device.channel_number, device.channel_info.get("unitCount", 1))
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        payload = self.messages.channel_status_json(
+            device.channel_number, device.channel_info.get("unitCount", 1), session_id
+        )
+        self.response_futures[session_id] = self.loop.create_future()
+        await self.async_publish(topic=topic, payload=payload, QoS=self.STATUS_REQUEST_QOS, session_id=session_id)
 
     async def _power_command(self, state, channel_number):
         """Unified power control command that routes to appropriate protocol implementation"""
-        if self._uses_mgpp_protocol():
+        if self._is_mgpp:
             await self._mgpp_power_command(state, channel_number)
         else:
             await self._legacy_power_command(state, channel_number)
@@ -927,40 +1266,37 @@ class NavilinkConnect:
         """Legacy protocol power control command"""
         state_num = 1 if state else 2
         topic = self.topics.control()
-        payload = self.messages.power(state_num, channel_number)
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        payload = self.messages.control_json(self.messages.power, state_num, channel_number, session_id)
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_device_status(channel_number)
+        await self._refresh_status_after_command(channel_number)
 
     async def _mgpp_power_command(self, state, channel_number):
         """MGPP power control command"""
-        if not self._uses_mgpp_protocol():
+        if not self._is_mgpp:
             raise ValueError("MGPP power command only supported for MGPP protocol devices")
 
         topic = self.topics.mgpp_control()
-        payload = self.messages.mgpp_power(state, channel_number)
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_mgpp_status_all(wait_for_response=True)
+        payload = self.messages.control_json(self.messages.mgpp_power, state, channel_number, session_id)
+        self.response_futures[session_id] = self.loop.create_future()
+        response = await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        await self._refresh_status_after_command(channel_number, response)
 
     async def _hot_button_command(self, state, channel_number):
         """Hot button control command"""
         state_num = 1 if state else 2
         topic = self.topics.control()
-        payload = self.messages.hot_button(state_num, channel_number)
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        payload = self.messages.control_json(self.messages.hot_button, state_num, channel_number, session_id)
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_device_status(channel_number)
+        await self._refresh_status_after_command(channel_number)
 
     async def _temperature_command(self, temp, channel_number):
         """Unified temperature control command that routes to appropriate protocol implementation"""
-        if self._uses_mgpp_protocol():
+        if self._is_mgpp:
             await self._mgpp_temperature_command(temp, channel_number)
         else:
             await self._legacy_temperature_command(temp, channel_number)
@@ -971,87 +1307,96 @@ class NavilinkConnect:
         payload = self.messages.temperature(temp, channel_number)
         session_id = self.get_session_id()
         payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
+        self.response_futures[session_id] = self.loop.create_future()
         await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_device_status(channel_number)
+        await self._refresh_status_after_command(channel_number)
 
     async def _mgpp_temperature_command(self, temp, channel_number):
         """MGPP temperature control command"""
-        if not self._uses_mgpp_protocol():
+        if not self._is_mgpp:
             raise ValueError("MGPP temperature command only supported for MGPP protocol devices")
 
         topic = self.topics.mgpp_control()
         payload = self.messages.mgpp_temperature(temp, channel_number)
         session_id = self.get_session_id()
         payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_mgpp_status_all(wait_for_response=True)
+        self.response_futures[session_id] = self.loop.create_future()
+        response = await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        await self._refresh_status_after_command(channel_number, response)
 
     async def _mgpp_operation_mode_command(self, mode, channel_number, days=None):
         """MGPP operation mode control command"""
-        if not self._uses_mgpp_protocol():
+        if not self._is_mgpp:
             raise ValueError("MGPP operation mode only supported for MGPP protocol devices")
 
         topic = self.topics.mgpp_control()
         payload = self.messages.mgpp_operation_mode(mode, channel_number, days)
         session_id = self.get_session_id()
         payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_mgpp_status_all(wait_for_response=True)
+        self.response_futures[session_id] = self.loop.create_future()
+        response = await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        await self._refresh_status_after_command(channel_number, response)
 
     async def _mgpp_anti_legionella_command(self, state, channel_number):
         """MGPP anti-legionella control command"""
-        if not self._uses_mgpp_protocol():
+        if not self._is_mgpp:
             raise ValueError("MGPP anti-legionella only supported for MGPP protocol devices")
 
         topic = self.topics.mgpp_control()
-        payload = self.messages.mgpp_anti_legionella(state, channel_number)
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_mgpp_status_all(wait_for_response=True)
+        payload = self.messages.control_json(self.messages.mgpp_anti_legionella, state, channel_number, session_id)
+        self.response_futures[session_id] = self.loop.create_future()
+        response = await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        await self._refresh_status_after_command(channel_number, response)
 
     async def _mgpp_freeze_protection_command(self, state, channel_number):
         """MGPP freeze protection control command"""
-        if not self._uses_mgpp_protocol():
+        if not self._is_mgpp:
             raise ValueError("MGPP freeze protection only supported for MGPP protocol devices")
 
         topic = self.topics.mgpp_control()
-        payload = self.messages.mgpp_freeze_protection(state, channel_number)
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_mgpp_status_all(wait_for_response=True)
+        payload = self.messages.control_json(self.messages.mgpp_freeze_protection, state, channel_number, session_id)
+        self.response_futures[session_id] = self.loop.create_future()
+        response = await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        await self._refresh_status_after_command(channel_number, response)
 
     async def _mgpp_recirc_hot_button_command(self, state, channel_number):
         """MGPP recirculation hot button control command"""
-        if not self._uses_mgpp_protocol():
+        if not self._is_mgpp:
             raise ValueError("MGPP recirculation hot button only supported for MGPP protocol devices")
 
         topic = self.topics.mgpp_control()
-        payload = self.messages.mgpp_recirc_hot_button(state, channel_number)
         session_id = self.get_session_id()
-        payload["sessionID"] = session_id
-        self.response_events[session_id] = asyncio.Event()
-        await self.async_publish(topic=topic, payload=payload, session_id=session_id)
-        await self._get_mgpp_status_all(wait_for_response=True)
+        payload = self.messages.control_json(self.messages.mgpp_recirc_hot_button, state, channel_number, session_id)
+        self.response_futures[session_id] = self.loop.create_future()
+        response = await self.async_publish(topic=topic, payload=payload, session_id=session_id)
+        await self._refresh_status_after_command(channel_number, response)
 
     def get_session_id(self):
-        return str(int(round((datetime.utcnow() - datetime(1970, 1, 1)).total_seconds() * 1000)))
+        session_id = time.time_ns() // 1_000_000
+        # Batched requests are built within the same millisecond; keep their ids distinct
+        if session_id <= self._last_session_id:
+            session_id = self._last_session_id + 1
+        self._last_session_id = session_id
+        return str(session_id)
+
+    def _resolve_response(self, session_id, response):
+        """Hand a parsed response to the command awaiting session_id, if any."""
+        if response_future := self.response_futures.get(session_id, None):
+            if not response_future.done():
+                response_future.set_result(response)
+            return True
+        return False
 
     def _mark_data_received(self):
         """Mark that data was received, updating the connection health tracking."""
-        self.last_data_received = datetime.now()
-        _LOGGER.debug(f"Data received, updated last_data_received to {self.last_data_received}")
+        self.last_data_received = self.loop.time()
 
     def async_handle_device_info(self, client, userdata, message):
         """Handle channel info response for legacy devices."""
-        response = json.loads(message.payload)
-        _LOGGER.debug(f"Device info response: {response}")
+        response = _json_loads(message.payload)
+        _LOGGER.debug("Device info response: %s", response)
         self._mark_data_received()
         channel_info = response.get("response", {})
         session_id = response.get("sessionID", "unknown")
@@ -1065,26 +1410,21 @@ class NavilinkConnect:
                 channel_info=channel.get("channel", {}),
                 gateway=self
             )
+        self.invalidate_enabled_devices()
+        if self.coordinator:
+            self.coordinator.invalidate_devices()
         
-        if response_event := self.response_events.get(session_id, None):
-            response_event.set()
-
-    def handle_device_info(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_device_info, client, userdata, message)
+        self._resolve_response(session_id, response)
 
     def async_handle_device_status(self, client, userdata, message):
         """Handle channel status response for legacy devices."""
-        response = json.loads(message.payload)
+        response = _json_loads(message.payload)
         self._mark_data_received()
         channel_status = response.get("response", {}).get("channelStatus", {})
         session_id = response.get("sessionID", "unknown")
         if device := self.devices.get(channel_status.get("channelNumber", 0), None):
             device.update_channel_status(channel_status.get("channel", {}))
-        if response_event := self.response_events.get(session_id, None):
-            response_event.set()
-
-    def handle_device_status(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_device_status, client, userdata, message)
+        self._resolve_response(session_id, response)
 
     def handle_weekly_schedule(self, client, userdata, message):
         _LOGGER.info("WEEKLY SCHEDULE: " + message.payload.decode('utf-8') + '\n')
@@ -1102,93 +1442,73 @@ class NavilinkConnect:
         _LOGGER.info("MONTHLY TREND: " + message.payload.decode('utf-8') + '\n')
 
     def async_handle_mgpp_did(self, client, userdata, message):
-        response = json.loads(message.payload)
-        _LOGGER.debug("MGPP DID Response: " + json.dumps(response, indent=2))
+        response = _json_loads(message.payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("MGPP DID Response: %s", _json_pretty(response))
         self._mark_data_received()
         session_id = response.get("sessionID", "unknown")
 
-        if len(self.devices) > 0:
-            device = list(self.devices.values())[0]
-            if hasattr(device, 'did_features'):
-                feature_data = response.get("response", {}).get("feature", {})
-                device.did_features = feature_data
-                _LOGGER.debug(f"Stored DID feature data: {feature_data}")
+        device = next(iter(self.devices.values()), None)
+        if isinstance(device, MgppDevice):
+            feature_data = response.get("response", {}).get("feature", {})
+            device.did_features = feature_data
+            _LOGGER.debug("Stored DID feature data: %s", feature_data)
 
-        if response_event := self.response_events.get(session_id, None):
-            response_event.set()
-        else:
-            _LOGGER.debug(f"No response event found for session ID: {session_id}")
-
-    def handle_mgpp_did(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_mgpp_did, client, userdata, message)
+        if not self._resolve_response(session_id, response):
+            _LOGGER.debug("No pending response found for session ID: %s", session_id)
 
     def async_handle_mgpp_status(self, client, userdata, message):
-        response = json.loads(message.payload)
-        _LOGGER.debug("MGPP STATUS Response: " + json.dumps(response, indent=2))
+        response = _json_loads(message.payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("MGPP STATUS Response: %s", _json_pretty(response))
         self._mark_data_received()
         session_id = response.get("sessionID", "unknown")
-        if response_event := self.response_events.get(session_id, None):
-            response_event.set()
-            _LOGGER.debug(f"Set response event for session ID: {session_id}")
+        if self._resolve_response(session_id, response):
+            _LOGGER.debug("Resolved response for session ID: %s", session_id)
         else:
-            _LOGGER.debug(f"No response event found for session ID: {session_id}")
+            _LOGGER.debug("No pending response found for session ID: %s", session_id)
         for device in self.devices.values():
-            if hasattr(device, 'update_channel_status'):
-                _LOGGER.debug(f"Updating device {device.channel_number} with status response")
+            if isinstance(device, MgppDevice):
+                _LOGGER.debug("Updating device %s with status response", device.channel_number)
                 device.update_channel_status('status', response)
 
-    def handle_mgpp_status(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_mgpp_status, client, userdata, message)
-
     def async_handle_mgpp_rsv(self, client, userdata, message):
-        response = json.loads(message.payload)
-        _LOGGER.debug("MGPP RSV Response: " + json.dumps(response, indent=2))
+        response = _json_loads(message.payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("MGPP RSV Response: %s", _json_pretty(response))
         self._mark_data_received()
         session_id = response.get("sessionID", "unknown")
-        if response_event := self.response_events.get(session_id, None):
-            response_event.set()
-        else:
-            _LOGGER.debug(f"No response event found for session ID: {session_id}")
+        if not self._resolve_response(session_id, response):
+            _LOGGER.debug("No pending response found for session ID: %s", session_id)
         for device in self.devices.values():
-            if hasattr(device, 'update_channel_status'):
+            if isinstance(device, MgppDevice):
                 device.update_channel_status('rsv', response)
 
-    def handle_mgpp_rsv(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_mgpp_rsv, client, userdata, message)
-
     def async_handle_mgpp_ctrl_fail(self, client, userdata, message):
         """Handle MGPP control failure notifications per spec"""
-        response = json.loads(message.payload)
-        _LOGGER.warning("MGPP Control Failure: " + json.dumps(response, indent=2))
+        response = _json_loads(message.payload)
+        _LOGGER.warning("MGPP Control Failure: " + _json_pretty(response))
         fail_code = response.get("response", {}).get("failCode", 0)
         if fail_code == 2:
             _LOGGER.error("Control interval exceeded - command rejected by platform")
         else:
             _LOGGER.warning(f"Control failure with code: {fail_code}")
 
-    def handle_mgpp_ctrl_fail(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_mgpp_ctrl_fail, client, userdata, message)
-
     def async_handle_mgpp_connection(self, client, userdata, message):
         """Handle MGPP connection heartbeat events per spec"""
-        response = json.loads(message.payload)
-        _LOGGER.debug("MGPP Connection Event: " + json.dumps(response, indent=2))
+        response = _json_loads(message.payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("MGPP Connection Event: %s", _json_pretty(response))
         event_data = response.get("event", {})
         connection = event_data.get("connection", {})
         status = connection.get("status", 0)
         if status <= 0:
             _LOGGER.warning("Device connection status indicates disconnect (status <= 0)")
 
-    def handle_mgpp_connection(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_mgpp_connection, client, userdata, message)
-
     def async_handle_mgpp_disconnect(self, client, userdata, message):
         """Handle MGPP disconnect broadcast per spec"""
         _LOGGER.warning("MGPP Disconnect Broadcast received - device MQTT session dropped")
 
-    def handle_mgpp_disconnect(self, client, userdata, message):
-        self.loop.call_soon_threadsafe(self.async_handle_mgpp_disconnect, client, userdata, message)
-
     def handle_other(self, client, userdata, message):
         _LOGGER.info(message.payload.decode('utf-8') + '\n')
 
@@ -1196,14 +1516,23 @@ class NavilinkConnect:
 class NavilinkDevice:
     """Represents a single water heater device (legacy protocol)."""
 
+    __slots__ = (
+        "channel_number", "channel_info", "gateway", "callbacks", "channel_status",
+        "_raw_channel_status", "unit_list", "command_lock", "_published_available",
+        "_pending_publish",
+    )
+
     def __init__(self, channel_number, channel_info, gateway) -> None:
         self.channel_number = channel_number
         self.channel_info = self.convert_channel_info(channel_info)
         self.gateway = gateway
-        self.callbacks = []
+        self.callbacks = set()
         self.channel_status = {}
+        self._raw_channel_status = None  # Serialized pre-conversion status, see update_channel_status
         self.unit_list = {}
-        self.waiting_for_response = False
+        self.command_lock = asyncio.Lock()  # Queues set_* calls in order; each publishes even on failure
+        self._published_available = None  # Availability at the last publish_update
+        self._pending_publish = False  # Status change held back while command_lock was held
 
     @property
     def mac_address(self):
@@ -1233,46 +1562,73 @@ class NavilinkDevice:
         Legacy devices can be configured for Celsius or Fahrenheit.
         Wire encoding differs: Celsius uses half-degree encoding, Fahrenheit is raw.
         """
-        return self.channel_info.get("temperatureType", 2) != TemperatureType.FAHRENHEIT.value
+        return self.channel_info.get("temperatureType", 2) != _FAHRENHEIT
 
     def register_callback(self, callback):
-        self.callbacks.append(callback)
+        self.callbacks.add(callback)
 
     def deregister_callback(self, callback):
-        if self.callbacks:
-            self.callbacks.pop(self.callbacks.index(callback))
+        self.callbacks.discard(callback)
 
     def update_channel_status(self, channel_status):
-        self.channel_status = self.convert_channel_status(channel_status)
-        if not self.waiting_for_response:
-            self.publish_update()
+        # An identical raw status converts to the current one, so skip reconverting it
+        raw_channel_status = _json_dumps(channel_status)
+        if raw_channel_status == self._raw_channel_status:
+            changed = False
+        else:
+            channel_status = self.convert_channel_status(channel_status)
+            # Recorded only once conversion succeeds, so a failing payload is retried
+            self._raw_channel_status = raw_channel_status
+            changed = channel_status != self.channel_status
+            self.channel_status = channel_status
+        if self._needs_publish(changed):
+            if self.command_lock.locked():
+                # The command publishes once it finishes; remember in case it fails first
+                self._pending_publish = True
+            else:
+                self.publish_update()
+
+    def _needs_publish(self, changed):
+        """Return True if entities must be notified after a status update.
+        
+        Unchanged polls are skipped unless availability changed since the
+        last publish (e.g. the first status after a reconnect) or an earlier
+        change was held back during a command.
+        """
+        return changed or self._pending_publish or self._published_available != self.is_available()
 
     def publish_update(self):
+        self._published_available = self.is_available()
+        self._pending_publish = False
         # Use coordinator's callback system for entity updates
         if self.gateway and self.gateway.coordinator:
             self.gateway.coordinator.publish_device_update(self.device_identifier)
         # Keep legacy callback support for backwards compatibility
-        if len(self.callbacks) > 0:
-            for callback in self.callbacks:
-                self.gateway.loop.call_soon_threadsafe(callback)
+        if self.callbacks:
+            self.gateway.loop.call_soon_threadsafe(self._invoke_callbacks)
+
+    def _invoke_callbacks(self):
+        """Run the legacy callbacks in one loop iteration, isolating failures."""
+        for callback in tuple(self.callbacks):
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Error in device update callback")
 
     async def set_power_state(self, state):
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
-                await self.gateway._power_command(state, self.channel_number)
-                self.publish_update()
+                # Legacy devices only live on legacy gateways, so skip the protocol dispatch
+                await self.gateway._legacy_power_command(state, self.channel_number)
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     async def set_hot_button_state(self, state):
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 await self.gateway._hot_button_command(state, self.channel_number)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     async def set_temperature(self, temp):
         """Set target temperature.
@@ -1282,8 +1638,7 @@ class NavilinkDevice:
                   For Celsius devices, this will be encoded as half-degree format.
                   For Fahrenheit devices, this is sent as-is.
         """
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 # Encode temperature for wire protocol
                 if self.is_celsius:
@@ -1292,81 +1647,23 @@ class NavilinkDevice:
                 else:
                     # Fahrenheit devices send raw °F value
                     wire_temp = int(round(temp))
-                await self.gateway._temperature_command(wire_temp, self.channel_number)
-                self.publish_update()
+                await self.gateway._legacy_temperature_command(wire_temp, self.channel_number)
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     def convert_channel_status(self, channel_status):
         channel_status["powerStatus"] = channel_status["powerStatus"] == 1
         channel_status["onDemandUseFlag"] = channel_status["onDemandUseFlag"] == 1
         channel_status["avgCalorie"] = channel_status["avgCalorie"] / 2.0
-        if self.channel_info.get("temperatureType", 2) == TemperatureType.CELSIUS.value:
-            if channel_status["unitType"] in [
-                DeviceSorting.NFC.value, DeviceSorting.NCB_H.value,
-                DeviceSorting.NFB.value, DeviceSorting.NVW.value,
-            ]:
-                GIUFactor = 100
-            else:
-                GIUFactor = 10
-
-            if channel_status["unitType"] in [
-                DeviceSorting.NPE.value, DeviceSorting.NPN.value, DeviceSorting.NPE2.value,
-                DeviceSorting.NCB.value, DeviceSorting.NFC.value, DeviceSorting.NCB_H.value,
-                DeviceSorting.CAS_NPE.value, DeviceSorting.CAS_NPN.value, DeviceSorting.CAS_NPE2.value,
-                DeviceSorting.NFB.value, DeviceSorting.NVW.value,
-                DeviceSorting.CAS_NFB.value, DeviceSorting.CAS_NVW.value,
-            ]:
-                channel_status["DHWSettingTemp"] = round(channel_status["DHWSettingTemp"] / 2.0, 1)
-                channel_status["avgInletTemp"] = round(channel_status["avgInletTemp"] / 2.0, 1)
-                channel_status["avgOutletTemp"] = round(channel_status["avgOutletTemp"] / 2.0, 1)
-                for i in range(channel_status.get("unitCount", 0)):
-                    channel_status["unitInfo"]["unitStatusList"][i]["gasInstantUsage"] = round(
-                        (channel_status["unitInfo"]["unitStatusList"][i]["gasInstantUsage"] * GIUFactor) / 10.0, 1
-                    )
-                    channel_status["unitInfo"]["unitStatusList"][i]["accumulatedGasUsage"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["accumulatedGasUsage"] / 10.0, 1
-                    )
-                    channel_status["unitInfo"]["unitStatusList"][i]["DHWFlowRate"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["DHWFlowRate"] / 10.0, 1
-                    )
-                    channel_status["unitInfo"]["unitStatusList"][i]["currentOutletTemp"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["currentOutletTemp"] / 2.0, 1
-                    )
-                    channel_status["unitInfo"]["unitStatusList"][i]["currentInletTemp"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["currentInletTemp"] / 2.0, 1
-                    )
-        elif self.channel_info.get("temperatureType", 2) == TemperatureType.FAHRENHEIT.value:
-            if channel_status["unitType"] in [
-                DeviceSorting.NFC.value, DeviceSorting.NCB_H.value,
-                DeviceSorting.NFB.value, DeviceSorting.NVW.value,
-            ]:
-                GIUFactor = 10
-            else:
-                GIUFactor = 1
-
-            if channel_status["unitType"] in [
-                DeviceSorting.NPE.value, DeviceSorting.NPN.value, DeviceSorting.NPE2.value,
-                DeviceSorting.NCB.value, DeviceSorting.NFC.value, DeviceSorting.NCB_H.value,
-                DeviceSorting.CAS_NPE.value, DeviceSorting.CAS_NPN.value, DeviceSorting.CAS_NPE2.value,
-                DeviceSorting.NFB.value, DeviceSorting.NVW.value,
-                DeviceSorting.CAS_NFB.value, DeviceSorting.CAS_NVW.value,
-            ]:
-                for i in range(channel_status.get("unitCount", 0)):
-                    channel_status["unitInfo"]["unitStatusList"][i]["gasInstantUsage"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["gasInstantUsage"] * GIUFactor * 3.968, 1
-                    )
-                    channel_status["unitInfo"]["unitStatusList"][i]["accumulatedGasUsage"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["accumulatedGasUsage"] * 35.314667 / 10.0, 1
-                    )
-                    channel_status["unitInfo"]["unitStatusList"][i]["DHWFlowRate"] = round(
-                        channel_status["unitInfo"]["unitStatusList"][i]["DHWFlowRate"] / 37.85, 1
-                    )
-
+        convert_units = _UNIT_STATUS_CONVERTERS.get(
+            (self.channel_info.get("temperatureType", 2), channel_status.get("unitType"))
+        )
+        if convert_units is not None:
+            convert_units(channel_status)
         return channel_status
 
     def convert_channel_info(self, channel_info):
-        if channel_info.get("temperatureType", 2) == TemperatureType.CELSIUS.value:
+        if channel_info.get("temperatureType", 2) == _CELSIUS:
             channel_info["setupDHWTempMin"] = round(channel_info["setupDHWTempMin"] / 2.0, 1)
             channel_info["setupDHWTempMax"] = round(channel_info["setupDHWTempMax"] / 2.0, 1)
         return channel_info
@@ -1375,14 +1672,88 @@ class NavilinkDevice:
         return self.gateway.connected
 
 
+@dataclass(slots=True)
+class MgppStatusFlags:
+    """On/off status flags decoded from an MGPP status response."""
+
+    heat_upper_use: bool = False
+    heat_lower_use: bool = False
+    comp_use: bool = False
+    eva_fan_use: bool = False
+    eev_use: bool = False
+    operation_busy: bool = False
+    recirc_hot_btn_ready: bool = False
+    recirc_pump_operation_status: bool = False
+
+    @classmethod
+    def from_status(cls, status):
+        """Decode flags from a raw status dict (MGPP uses 1=off, 2=on)."""
+        return cls(**{
+            attr: status.get(key, 0) == 2
+            for key, attr in MgppDevice.STATUS_FLAG_ATTRS.items()
+        })
+
+
+@dataclass(slots=True)
+class MgppTemperatures:
+    """Celsius temperatures decoded from an MGPP status response."""
+
+    dhw_temperature: float = 0.0
+    dhw_temperature_setting: float = 0.0
+    tank_upper_temperature: float = 0.0
+    tank_lower_temperature: float = 0.0
+    ambient_temperature: float = 0.0
+    discharge_temperature: float = 0.0
+    suction_temperature: float = 0.0
+    evaporator_temperature: float = 0.0
+    current_superheat: float = 0.0
+    target_superheat: float = 0.0
+    recirc_faucet_temperature: float = 0.0
+
+    @classmethod
+    def from_status(cls, status):
+        """Decode temperatures from a raw status dict."""
+        return cls(
+            dhw_temperature=_decode_half_degree_celsius(status.get('dhwTemperature', 0)),
+            dhw_temperature_setting=_decode_half_degree_celsius(status.get('dhwTemperatureSetting', 0)),
+            tank_upper_temperature=_decode_tenth_degree_celsius(status.get('tankUpperTemperature', 0)),
+            tank_lower_temperature=_decode_tenth_degree_celsius(status.get('tankLowerTemperature', 0)),
+            ambient_temperature=_decode_tenth_degree_celsius(status.get('ambientTemperature', 0)),
+            discharge_temperature=_decode_tenth_degree_celsius(status.get('dischargeTemperature', 0)),
+            suction_temperature=_decode_tenth_degree_celsius(status.get('suctionTemperature', 0)),
+            evaporator_temperature=_decode_tenth_degree_celsius(status.get('evaporatorTemperature', 0)),
+            current_superheat=_decode_tenth_degree_celsius(status.get('currentSuperHeat', 0)),
+            target_superheat=_decode_tenth_degree_celsius(status.get('targetSuperHeat', 0)),
+            recirc_faucet_temperature=_decode_tenth_degree_celsius(status.get('recircFaucetTemperature', 0)),
+        )
+
+
 class MgppDevice:
     """Represents a single MGPP water heater device."""
 
+    __slots__ = (
+        "channel_number", "channel_info", "gateway", "callbacks", "channel_status",
+        "raw_responses", "did_features", "command_lock", "_published_available", "_pending_publish",
+        "vacation_days", "status_flags", "temperatures",
+    )
+
+    # Mapping from MGPP status flag key to its MgppStatusFlags field
+    STATUS_FLAG_ATTRS = {
+        'heatUpperUse': 'heat_upper_use',
+        'heatLowerUse': 'heat_lower_use',
+        'compUse': 'comp_use',
+        'evaFanUse': 'eva_fan_use',
+        'eevUse': 'eev_use',
+        'operationBusy': 'operation_busy',
+        'recircHotBtnReady': 'recirc_hot_btn_ready',
+        'recircPumpOperationStatus': 'recirc_pump_operation_status',
+    }
+
     def __init__(self, channel_number, channel_info, gateway, did_features=None) -> None:
         self.channel_number = channel_number
         self.channel_info = self.convert_channel_info(channel_info)
         self.gateway = gateway
-        self.callbacks = []
+        self.callbacks = set()
         self.channel_status = {}
         self.raw_responses = {
             'did': None,
@@ -1390,8 +1761,12 @@ class MgppDevice:
             'rsv': None
         }
         self.did_features = did_features or {}
-        self.waiting_for_response = False
+        self.command_lock = asyncio.Lock()  # Queues set_* calls in order; each publishes even on failure
+        self._published_available = None  # Availability at the last publish_update
+        self._pending_publish = False  # Status change held back while command_lock was held
         self.vacation_days = 7
+        self.status_flags = MgppStatusFlags()
+        self.temperatures = MgppTemperatures()
 
     @property
     def mac_address(self):
@@ -1427,12 +1802,12 @@ class MgppDevice:
     @property
     def dhw_temperature(self) -> float:
         """Current DHW temperature in Celsius."""
-        return _decode_half_degree_celsius(self.channel_status.get('dhwTemperature', 0))
+        return self.temperatures.dhw_temperature
 
     @property
     def dhw_temperature_setting(self) -> float:
         """Target DHW temperature setting in Celsius."""
-        return _decode_half_degree_celsius(self.channel_status.get('dhwTemperatureSetting', 0))
+        return self.temperatures.dhw_temperature_setting
 
     @property
     def dhw_temperature_min(self) -> float:
@@ -1448,87 +1823,113 @@ class MgppDevice:
     @property
     def tank_upper_temperature(self) -> float:
         """Tank upper temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('tankUpperTemperature', 0))
+        return self.temperatures.tank_upper_temperature
 
     @property
     def tank_lower_temperature(self) -> float:
         """Tank lower temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('tankLowerTemperature', 0))
+        return self.temperatures.tank_lower_temperature
 
     @property
     def ambient_temperature(self) -> float:
         """Ambient temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('ambientTemperature', 0))
+        return self.temperatures.ambient_temperature
 
     @property
     def discharge_temperature(self) -> float:
         """Discharge temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('dischargeTemperature', 0))
+        return self.temperatures.discharge_temperature
 
     @property
     def suction_temperature(self) -> float:
         """Suction temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('suctionTemperature', 0))
+        return self.temperatures.suction_temperature
 
     @property
     def evaporator_temperature(self) -> float:
         """Evaporator temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('evaporatorTemperature', 0))
+        return self.temperatures.evaporator_temperature
 
     @property
     def current_superheat(self) -> float:
         """Current superheat in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('currentSuperHeat', 0))
+        return self.temperatures.current_superheat
 
     @property
     def target_superheat(self) -> float:
         """Target superheat in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('targetSuperHeat', 0))
+        return self.temperatures.target_superheat
 
     @property
     def recirc_faucet_temperature(self) -> float:
         """Recirculation faucet temperature in Celsius."""
-        return _decode_tenth_degree_celsius(self.channel_status.get('recircFaucetTemperature', 0))
+        return self.temperatures.recirc_faucet_temperature
 
     def register_callback(self, callback):
-        self.callbacks.append(callback)
+        self.callbacks.add(callback)
 
     def deregister_callback(self, callback):
-        if self.callbacks:
-            self.callbacks.pop(self.callbacks.index(callback))
+        self.callbacks.discard(callback)
 
     def update_channel_status(self, response_type, response_data):
         """Update channel status with raw response data (no conversion here)."""
         self.raw_responses[response_type] = response_data
-        _LOGGER.debug(f"MGPP {response_type.upper()} Response: {json.dumps(response_data, indent=2)}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("MGPP %s Response: %s", response_type.upper(), _json_pretty(response_data))
 
-        if response_type == 'status' and 'response' in response_data:
-            status_data = response_data['response'].get('status', {})
+        changed = False
+        if response_type == 'status':
+            if 'response' in response_data:
+                status_data = response_data['response'].get('status', {})
+            else:
+                status_data = response_data
+            changed = status_data != self.channel_status
             self.channel_status = status_data
-        elif response_type == 'status':
-            self.channel_status = response_data
+            if changed:
+                self.status_flags = MgppStatusFlags.from_status(self.channel_status)
+                self.temperatures = MgppTemperatures.from_status(self.channel_status)
+
+        if self._needs_publish(changed):
+            if self.command_lock.locked():
+                # The command publishes once it finishes; remember in case it fails first
+                self._pending_publish = True
+            else:
+                self.publish_update()
 
-        if not self.waiting_for_response:
-            self.publish_update()
+    def _needs_publish(self, changed):
+        """Return True if entities must be notified after a status update.
+        
+        Unchanged polls are skipped unless availability changed since the
+        last publish (e.g. the first status after a reconnect) or an earlier
+        change was held back during a command.
+        """
+        return changed or self._pending_publish or self._published_available != self.is_available()
 
     def publish_update(self):
+        self._published_available = self.is_available()
+        self._pending_publish = False
         # Use coordinator's callback system for entity updates
         if self.gateway and self.gateway.coordinator:
             self.gateway.coordinator.publish_device_update(self.device_identifier)
         # Keep legacy callback support for backwards compatibility
-        if len(self.callbacks) > 0:
-            for callback in self.callbacks:
-                self.gateway.loop.call_soon_threadsafe(callback)
+        if self.callbacks:
+            self.gateway.loop.call_soon_threadsafe(self._invoke_callbacks)
+
+    def _invoke_callbacks(self):
+        """Run the legacy callbacks in one loop iteration, isolating failures."""
+        for callback in tuple(self.callbacks):
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Error in device update callback")
 
     async def set_power_state(self, state):
         """Set MGPP device power state"""
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 await self.gateway._mgpp_power_command(state, self.channel_number)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     async def set_temperature(self, temp_celsius):
         """Set MGPP device temperature.
@@ -1536,46 +1937,38 @@ class MgppDevice:
         Args:
             temp_celsius: Temperature in Celsius (MGPP always uses Celsius).
         """
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 # MGPP always uses half-degree Celsius encoding
                 raw_temp = _encode_half_degree_celsius(temp_celsius)
                 await self.gateway._mgpp_temperature_command(raw_temp, self.channel_number)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     async def set_operation_mode(self, mode, days=None):
         """Set MGPP operation mode"""
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 vacation_days = days if days is not None else self.vacation_days
                 await self.gateway._mgpp_operation_mode_command(mode, self.channel_number, vacation_days)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     async def set_anti_legionella_state(self, state):
         """Set MGPP anti-legionella state"""
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 await self.gateway._mgpp_anti_legionella_command(state, self.channel_number)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     async def set_freeze_protection_state(self, state):
         """Set MGPP freeze protection state"""
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 await self.gateway._mgpp_freeze_protection_command(state, self.channel_number)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     @property
     def supports_recirculation(self):
@@ -1585,23 +1978,22 @@ class MgppDevice:
 
     async def set_recirc_hot_button_state(self, state):
         """Set MGPP recirculation hot button state"""
-        if not self.waiting_for_response:
-            self.waiting_for_response = True
+        async with self.command_lock:
             try:
                 await self.gateway._mgpp_recirc_hot_button_command(state, self.channel_number)
-                self.publish_update()
             finally:
-                self.waiting_for_response = False
+                self.publish_update()
 
     def get_error_message(self):
         """Get human-readable error message if device has errors"""
-        if not self.channel_status.get('hasError', False):
+        status = self.channel_status
+        if not status.get('hasError', False):
             return None
 
-        error_code = self.channel_status.get('errorCode', 0)
-        sub_error_code = self.channel_status.get('subErrorCode', 0)
-        fault1 = self.channel_status.get('faultStatus1', 0)
-        fault2 = self.channel_status.get('faultStatus2', 0)
+        error_code = status.get('errorCode', 0)
+        sub_error_code = status.get('subErrorCode', 0)
+        fault1 = status.get('faultStatus1', 0)
+        fault2 = status.get('faultStatus2', 0)
 
         if error_code != 0:
             return f"Error Code: {error_code} (Sub: {sub_error_code})"
@@ -1612,17 +2004,14 @@ class MgppDevice:
 
     def convert_channel_info(self, channel_info):
         """Convert channel info to include required fields for water_heater.py compatibility"""
-        if "temperatureType" not in channel_info:
-            channel_info["temperatureType"] = TemperatureType.FAHRENHEIT.value
+        temperature_type = channel_info.setdefault("temperatureType", TemperatureType.FAHRENHEIT)
+        temp_min = channel_info.setdefault("setupDHWTempMin", 100)
+        temp_max = channel_info.setdefault("setupDHWTempMax", 140)
 
-        if "setupDHWTempMin" not in channel_info:
-            channel_info["setupDHWTempMin"] = 100
-        if "setupDHWTempMax" not in channel_info:
-            channel_info["setupDHWTempMax"] = 140
-
-        if channel_info.get("temperatureType", TemperatureType.FAHRENHEIT.value) == TemperatureType.CELSIUS.value:
-            channel_info["setupDHWTempMin"] = round(channel_info["setupDHWTempMin"] / 2.0, 1)
-            channel_info["setupDHWTempMax"] = round(channel_info["setupDHWTempMax"] / 2.0, 1)
+        if temperature_type == TemperatureType.CELSIUS:
+            # Raw limits are whole half-degrees, so halving is exact to one decimal
+            channel_info["setupDHWTempMin"] = temp_min * 0.5
+            channel_info["setupDHWTempMax"] = temp_max * 0.5
 
         return channel_info
 
@@ -1630,157 +2019,236 @@ class MgppDevice:
         return self.gateway.connected
 
 
-class MgppTopics:
+# Broadcast topic, identical for every device and protocol
+_DISCONNECT_TOPIC = 'evt/+/mobile/event/disconnect-mqtt'
+
+
+class _TopicPrefixes:
+    """Device identity and request/response prefixes shared by both protocols."""
+
+    __slots__ = ("user_seq", "mac_address", "home_seq", "device_type", "client_id", "req", "res")
+
     def __init__(self, user_info, device_info, client_id) -> None:
         self.user_seq = str(user_info.get("userInfo", {}).get("userSeq", ""))
-        self.mac_address = device_info.get("deviceInfo", {}).get("macAddress", "")
-        self.home_seq = str(device_info.get("deviceInfo", {}).get("homeSeq", ""))
-        self.device_type = str(device_info.get("deviceInfo", {}).get("deviceType", ""))
+        device = device_info.get("deviceInfo", {})
+        self.mac_address = device.get("macAddress", "")
+        self.home_seq = str(device.get("homeSeq", ""))
+        self.device_type = str(device.get("deviceType", ""))
         self.client_id = client_id
         self.req = f'cmd/{self.device_type}/navilink-{self.mac_address}/'
         self.res = f'cmd/{self.device_type}/{self.home_seq}/{self.user_seq}/{self.client_id}/res/'
+
+
+class MgppTopics(_TopicPrefixes):
+    __slots__ = (
+        "mgpp", "_mgpp_default", "_mgpp_res_did", "_mgpp_res", "_mgpp_res_rsv_rd",
+        "_mgpp_st_did", "_mgpp_st", "_mgpp_st_rsv_rd", "_mgpp_control",
+        "_mgpp_ctrl_fail", "_mgpp_connection", "_app_connection",
+    )
+
+    def __init__(self, user_info, device_info, client_id) -> None:
+        super().__init__(user_info, device_info, client_id)
         self.mgpp = f'cmd/{self.device_type}/{self.home_seq}/{self.user_seq}/{self.client_id}/'
+        # Topics are fixed per connection, so build each string once
+        self._mgpp_default = self.req + 'res'
+        self._mgpp_res_did = self.mgpp + 'res/did'
+        self._mgpp_res = self.mgpp + 'res'
+        self._mgpp_res_rsv_rd = self.mgpp + 'res/rsv/rd'
+        self._mgpp_st_did = self.req + 'st/did'
+        self._mgpp_st = self.req + 'st'
+        self._mgpp_st_rsv_rd = self.req + 'st/rsv/rd'
+        self._mgpp_control = self.req + 'ctrl'
+        self._mgpp_ctrl_fail = self.req + 'ctrl-fail'
+        self._mgpp_connection = f'evt/{self.device_type}/navilink-{self.mac_address}/connection'
+        self._app_connection = f'evt/{self.device_type}/navilink-{self.mac_address}/app-connection'
 
     def mgpp_default(self):
-        return self.req + 'res'
+        return self._mgpp_default
 
     def mgpp_res_did(self):
-        return self.mgpp + 'res/did'
+        return self._mgpp_res_did
 
     def mgpp_res(self):
-        return self.mgpp + 'res'
+        return self._mgpp_res
 
     def mgpp_res_rsv_rd(self):
-        return self.mgpp + 'res/rsv/rd'
+        return self._mgpp_res_rsv_rd
 
     def mgpp_st_did(self):
-        return self.req + 'st/did'
+        return self._mgpp_st_did
 
     def mgpp_st(self):
-        return self.req + 'st'
+        return self._mgpp_st
 
     def mgpp_st_rsv_rd(self):
-        return self.req + 'st/rsv/rd'
+        return self._mgpp_st_rsv_rd
 
     def mgpp_control(self):
         """MGPP control topic - uses ctrl endpoint per spec"""
-        return self.req + 'ctrl'
+        return self._mgpp_control
 
     def mgpp_ctrl_fail(self):
         """MGPP control failure topic per spec"""
-        return self.req + 'ctrl-fail'
+        return self._mgpp_ctrl_fail
 
     def mgpp_connection(self):
         """MGPP device connection event topic per spec (legacy fallback)"""
-        return f'evt/{self.device_type}/navilink-{self.mac_address}/connection'
+        return self._mgpp_connection
 
     def mgpp_disconnect(self):
         """MGPP disconnect broadcast topic per spec"""
-        return 'evt/+/mobile/event/disconnect-mqtt'
+        return _DISCONNECT_TOPIC
 
     def app_connection(self):
-        return f'evt/{self.device_type}/navilink-{self.mac_address}/app-connection'
+        return self._app_connection
 
 
-class Topics:
+class Topics(_TopicPrefixes):
     """Topics for legacy protocol devices."""
 
+    __slots__ = (
+        "_start", "_channel_info_sub", "_channel_info_res", "_control_fail",
+        "_channel_status_sub", "_channel_status_req", "_channel_status_res",
+        "_weekly_schedule_sub", "_weekly_schedule_req", "_weekly_schedule_res",
+        "_simple_trend_sub", "_simple_trend_req", "_simple_trend_res",
+        "_hourly_trend_sub", "_hourly_trend_req", "_hourly_trend_res",
+        "_daily_trend_sub", "_daily_trend_req", "_daily_trend_res",
+        "_monthly_trend_sub", "_monthly_trend_req", "_monthly_trend_res", "_control",
+        "_connection", "_app_connection",
+    )
+
     def __init__(self, user_info, device_info, client_id) -> None:
-        self.user_seq = str(user_info.get("userInfo", {}).get("userSeq", ""))
-        self.mac_address = device_info.get("deviceInfo", {}).get("macAddress", "")
-        self.home_seq = str(device_info.get("deviceInfo", {}).get("homeSeq", ""))
-        self.device_type = str(device_info.get("deviceInfo", {}).get("deviceType", ""))
-        self.client_id = client_id
-        self.req = f'cmd/{self.device_type}/navilink-{self.mac_address}/'
-        self.res = f'cmd/{self.device_type}/{self.home_seq}/{self.user_seq}/{self.client_id}/res/'
+        super().__init__(user_info, device_info, client_id)
+        # Topics are fixed per connection, so build each string once
+        self._start = self.req + 'status/start'
+        self._channel_info_sub = self.req + 'res/channelinfo'
+        self._channel_info_res = self.res + 'channelinfo'
+        self._control_fail = self.req + 'res/controlfail'
+        self._channel_status_sub = self.req + 'res/channelstatus'
+        self._channel_status_req = self.req + 'status/channelstatus'
+        self._channel_status_res = self.res + 'channelstatus'
+        self._weekly_schedule_sub = self.req + 'res/weeklyschedule'
+        self._weekly_schedule_req = self.req + 'status/weeklyschedule'
+        self._weekly_schedule_res = self.res + 'weeklyschedule'
+        self._simple_trend_sub = self.req + 'res/simpletrend'
+        self._simple_trend_req = self.req + 'status/simpletrend'
+        self._simple_trend_res = self.res + 'simpletrend'
+        self._hourly_trend_sub = self.req + 'res/hourlytrend'
+        self._hourly_trend_req = self.req + 'status/hourlytrend'
+        self._hourly_trend_res = self.res + 'hourlytrend'
+        self._daily_trend_sub = self.req + 'res/dailytrend'
+        self._daily_trend_req = self.req + 'status/dailytrend'
+        self._daily_trend_res = self.res + 'dailytrend'
+        self._monthly_trend_sub = self.req + 'res/monthlytrend'
+        self._monthly_trend_req = self.req + 'status/monthlytrend'
+        self._monthly_trend_res = self.res + 'monthlytrend'
+        self._control = self.req + 'control'
+        self._connection = self.req + 'connection'
+        self._app_connection = f'evt/1/navilink-{self.mac_address}/app-connection'
 
     def start(self):
-        return self.req + 'status/start'
+        return self._start
 
     def channel_info_sub(self):
-        return self.req + 'res/channelinfo'
+        return self._channel_info_sub
 
     def channel_info_res(self):
-        return self.res + 'channelinfo'
+        return self._channel_info_res
 
     def control_fail(self):
-        return self.req + 'res/controlfail'
+        return self._control_fail
 
     def channel_status_sub(self):
-        return self.req + 'res/channelstatus'
+        return self._channel_status_sub
 
     def channel_status_req(self):
-        return self.req + 'status/channelstatus'
+        return self._channel_status_req
 
     def channel_status_res(self):
-        return self.res + 'channelstatus'
+        return self._channel_status_res
 
     def weekly_schedule_sub(self):
-        return self.req + 'res/weeklyschedule'
+        return self._weekly_schedule_sub
 
     def weekly_schedule_req(self):
-        return self.req + 'status/weeklyschedule'
+        return self._weekly_schedule_req
 
     def weekly_schedule_res(self):
-        return self.res + 'weeklyschedule'
+        return self._weekly_schedule_res
 
     def simple_trend_sub(self):
-        return self.req + 'res/simpletrend'
+        return self._simple_trend_sub
 
     def simple_trend_req(self):
-        return self.req + 'status/simpletrend'
+        return self._simple_trend_req
 
     def simple_trend_res(self):
-        return self.res + 'simpletrend'
+        return self._simple_trend_res
 
     def hourly_trend_sub(self):
-        return self.req + 'res/hourlytrend'
+        return self._hourly_trend_sub
 
     def hourly_trend_req(self):
-        return self.req + 'status/hourlytrend'
+        return self._hourly_trend_req
 
     def hourly_trend_res(self):
-        return self.res + 'hourlytrend'
+        return self._hourly_trend_res
 
     def daily_trend_sub(self):
-        return self.req + 'res/dailytrend'
+        return self._daily_trend_sub
 
     def daily_trend_req(self):
-        return self.req + 'status/dailytrend'
+        return self._daily_trend_req
 
     def daily_trend_res(self):
-        return self.res + 'dailytrend'
+        return self._daily_trend_res
 
     def monthly_trend_sub(self):
-        return self.req + 'res/monthlytrend'
+        return self._monthly_trend_sub
 
     def monthly_trend_req(self):
-        return self.req + 'status/monthlytrend'
+        return self._monthly_trend_req
 
     def monthly_trend_res(self):
-        return self.res + 'monthlytrend'
+        return self._monthly_trend_res
 
     def control(self):
-        return self.req + 'control'
+        return self._control
 
     def connection(self):
-        return self.req + 'connection'
+        return self._connection
 
     def disconnect(self):
-        return 'evt/+/mobile/event/disconnect-mqtt'
+        return _DISCONNECT_TOPIC
 
     def app_connection(self):
-        return f'evt/1/navilink-{self.mac_address}/app-connection'
+        return self._app_connection
+
+
+# MGPP on/off controls as (off, on) pairs of (command, mode), indexed by state
+_MGPP_POWER_CONTROL = ((33554433, "power-off"), (33554434, "power-on"))
+_MGPP_ANTI_LEGIONELLA_CONTROL = ((33554471, "anti-leg-off"), (33554472, "anti-leg-on"))
 
 
 class MgppMessages:
 
+    __slots__ = (
+        "mac_address", "device_type", "additional_value", "client_id", "topics",
+        "_mgpp_did_json", "_mgpp_status_json", "_mgpp_rsv_rd_json", "_control_json",
+    )
+
     def __init__(self, device_info, client_id, topics) -> None:
         self.mac_address = device_info.get("deviceInfo", {}).get("macAddress", "")
         self.device_type = int(device_info.get("deviceInfo", {}).get("deviceType", 1))
         self.additional_value = device_info.get("deviceInfo", {}).get("additionalValue", "")
         self.client_id = client_id
         self.topics = topics
+        # Constant payloads serialized once with an empty sessionID, see _with_session_id
+        self._mgpp_did_json = None
+        self._mgpp_status_json = None
+        self._mgpp_rsv_rd_json = None
+        # (builder, state, channel_number) -> on/off control message, see control_json
+        self._control_json = {}
 
     def mgpp_did(self):
         return {
@@ -1827,10 +2295,39 @@ class MgppMessages:
             "sessionID": ""
         }
 
+    def mgpp_did_json(self, session_id):
+        """Serialized mgpp_did() message for the given session."""
+        if self._mgpp_did_json is None:
+            self._mgpp_did_json = _json_dumps(self.mgpp_did())
+        return _with_session_id(self._mgpp_did_json, session_id)
+
+    def mgpp_status_json(self, session_id):
+        """Serialized mgpp_status() message for the given session."""
+        if self._mgpp_status_json is None:
+            self._mgpp_status_json = _json_dumps(self.mgpp_status())
+        return _with_session_id(self._mgpp_status_json, session_id)
+
+    def mgpp_rsv_rd_json(self, session_id):
+        """Serialized mgpp_rsv_rd() message for the given session."""
+        if self._mgpp_rsv_rd_json is None:
+            self._mgpp_rsv_rd_json = _json_dumps(self.mgpp_rsv_rd())
+        return _with_session_id(self._mgpp_rsv_rd_json, session_id)
+
+    def control_json(self, build_message, state, channel_number, session_id):
+        """Serialized on/off control message for the given session.
+        
+        build_message is one of this class's (state, channel_number) builders, which
+        only yield two payloads per channel, so each is serialized once.
+        """
+        key = (build_message.__name__, state, channel_number)
+        if (payload_json := self._control_json.get(key)) is None:
+            payload_json = _json_dumps(build_message(state, channel_number))
+            self._control_json[key] = payload_json
+        return _with_session_id(payload_json, session_id)
+
     def mgpp_power(self, state, channel_number):
         """MGPP power control message - uses RequestMgppControl structure per spec"""
-        command_id = 33554434 if state else 33554433
-        mode_str = "power-on" if state else "power-off"
+        command_id, mode_str = _MGPP_POWER_CONTROL[bool(state)]
         return {
             "clientID": self.client_id,
             "protocolVersion": 2,
@@ -1892,8 +2389,7 @@ class MgppMessages:
 
     def mgpp_anti_legionella(self, state, channel_number):
         """MGPP anti-legionella control message - uses RequestMgppControl structure per spec"""
-        command_id = 33554472 if state else 33554471
-        mode_str = "anti-leg-on" if state else "anti-leg-off"
+        command_id, mode_str = _MGPP_ANTI_LEGIONELLA_CONTROL[bool(state)]
         param = [7] if state else []
         return {
             "clientID": self.client_id,
@@ -1972,12 +2468,23 @@ class MgppMessages:
 
 class Messages:
 
+    __slots__ = (
+        "mac_address", "device_type", "additional_value", "client_id", "topics",
+        "_channel_info_json", "_channel_status_json", "_control_json",
+    )
+
     def __init__(self, device_info, client_id, topics) -> None:
         self.mac_address = device_info.get("deviceInfo", {}).get("macAddress", "")
         self.device_type = int(device_info.get("deviceInfo", {}).get("deviceType", 1))
         self.additional_value = device_info.get("deviceInfo", {}).get("additionalValue", "")
         self.client_id = client_id
         self.topics = topics
+        # channel_info() serialized once with an empty sessionID, see _with_session_id
+        self._channel_info_json = None
+        # (channel_number, unit_count) -> status poll serialized with an empty sessionID
+        self._channel_status_json = {}
+        # (builder, state, channel_number) -> on/off control message, see control_json
+        self._control_json = {}
 
     def channel_info(self):
         return {
@@ -2014,6 +2521,32 @@ class Messages:
             "sessionID": ""
         }
 
+    def channel_info_json(self, session_id):
+        """Serialized channel_info() message for the given session."""
+        if self._channel_info_json is None:
+            self._channel_info_json = _json_dumps(self.channel_info())
+        return _with_session_id(self._channel_info_json, session_id)
+
+    def channel_status_json(self, channel_number, unit_count, session_id):
+        """Serialized channel_status() message for the given session."""
+        key = (channel_number, unit_count)
+        if (payload_json := self._channel_status_json.get(key)) is None:
+            payload_json = _json_dumps(self.channel_status(channel_number, unit_count))
+            self._channel_status_json[key] = payload_json
+        return _with_session_id(payload_json, session_id)
+
+    def control_json(self, build_message, state, channel_number, session_id):
+        """Serialized on/off control message for the given session.
+        
+        build_message is one of this class's (state, channel_number) builders, which
+        only yield two payloads per channel, so each is serialized once.
+        """
+        key = (build_message.__name__, state, channel_number)
+        if (payload_json := self._control_json.get(key)) is None:
+            payload_json = _json_dumps(build_message(state, channel_number))
+            self._control_json[key] = payload_json
+        return _with_session_id(payload_json, session_id)
+
     def power(self, state, channel_number):
         return {
             "clientID": self.client_id,
@@ -2089,7 +2622,7 @@ class Messages:
         }
 
 
-class DeviceSorting(enum.Enum):
+class DeviceSorting(enum.IntEnum):
     NO_DEVICE = 0
     NPE = 1
     NCB = 2
@@ -2108,12 +2641,70 @@ class DeviceSorting(enum.Enum):
     CAS_NVW = 15
 
 
-class TemperatureType(enum.Enum):
+class TemperatureType(enum.IntEnum):
     UNKNOWN = 0
     CELSIUS = 1
     FAHRENHEIT = 2
 
 
+_CELSIUS = TemperatureType.CELSIUS.value
+_FAHRENHEIT = TemperatureType.FAHRENHEIT.value
+
+# Unit types that report gas instant usage at ten times the base scale
+_HIGH_GIU_UNIT_TYPES = frozenset({
+    DeviceSorting.NFC.value, DeviceSorting.NCB_H.value,
+    DeviceSorting.NFB.value, DeviceSorting.NVW.value,
+})
+
+# Unit types whose temperatures and usage figures need wire conversion
+_CONVERTED_UNIT_TYPES = frozenset({
+    DeviceSorting.NPE.value, DeviceSorting.NPN.value, DeviceSorting.NPE2.value,
+    DeviceSorting.NCB.value, DeviceSorting.NFC.value, DeviceSorting.NCB_H.value,
+    DeviceSorting.CAS_NPE.value, DeviceSorting.CAS_NPN.value, DeviceSorting.CAS_NPE2.value,
+    DeviceSorting.NFB.value, DeviceSorting.NVW.value,
+    DeviceSorting.CAS_NFB.value, DeviceSorting.CAS_NVW.value,
+})
+
+
+def _convert_celsius_unit_status(channel_status, giu_factor):
+    """Decode the temperatures and usage figures of a Celsius legacy status."""
+    channel_status["DHWSettingTemp"] = round(channel_status["DHWSettingTemp"] / 2.0, 1)
+    channel_status["avgInletTemp"] = round(channel_status["avgInletTemp"] / 2.0, 1)
+    channel_status["avgOutletTemp"] = round(channel_status["avgOutletTemp"] / 2.0, 1)
+    unit_status_list = channel_status["unitInfo"]["unitStatusList"]
+    for i in range(channel_status.get("unitCount", 0)):
+        unit_status = unit_status_list[i]
+        unit_status["gasInstantUsage"] = round((unit_status["gasInstantUsage"] * giu_factor) / 10.0, 1)
+        unit_status["accumulatedGasUsage"] = round(unit_status["accumulatedGasUsage"] / 10.0, 1)
+        unit_status["DHWFlowRate"] = round(unit_status["DHWFlowRate"] / 10.0, 1)
+        unit_status["currentOutletTemp"] = round(unit_status["currentOutletTemp"] / 2.0, 1)
+        unit_status["currentInletTemp"] = round(unit_status["currentInletTemp"] / 2.0, 1)
+
+
+def _convert_fahrenheit_unit_status(channel_status, giu_factor):
+    """Decode the usage figures of a Fahrenheit legacy status."""
+    unit_status_list = channel_status["unitInfo"]["unitStatusList"]
+    for i in range(channel_status.get("unitCount", 0)):
+        unit_status = unit_status_list[i]
+        unit_status["gasInstantUsage"] = round(unit_status["gasInstantUsage"] * giu_factor * 3.968, 1)
+        unit_status["accumulatedGasUsage"] = round(unit_status["accumulatedGasUsage"] * 35.314667 / 10.0, 1)
+        unit_status["DHWFlowRate"] = round(unit_status["DHWFlowRate"] / 37.85, 1)
+
+
+# (temperatureType, unitType) -> converter with its gas usage factor bound;
+# unit types missing here are reported without conversion
+_UNIT_STATUS_CONVERTERS = {}
+for _unit_type in _CONVERTED_UNIT_TYPES:
+    _high_giu = _unit_type in _HIGH_GIU_UNIT_TYPES
+    _UNIT_STATUS_CONVERTERS[(_CELSIUS, _unit_type)] = functools.partial(
+        _convert_celsius_unit_status, giu_factor=100 if _high_giu else 10
+    )
+    _UNIT_STATUS_CONVERTERS[(_FAHRENHEIT, _unit_type)] = functools.partial(
+        _convert_fahrenheit_unit_status, giu_factor=10 if _high_giu else 1
+    )
+del _unit_type, _high_giu
+
+
 # Backwards compatibility aliases
 NavilinkChannel = NavilinkDevice
 MgppChannel = MgppDevice
@@ -9,7 +9,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity import NavienBaseEntity
 from .navien_api import MgppDevice
-from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,13 +17,12 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Navien vacation mode duration number entity based on a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    devices = []
-    
-    for device in coordinator.devices.values():
-        if isinstance(device, MgppDevice):
-            # Only create for MGPP devices
-            devices.append(NavienVacationModeDurationNumberEntity(coordinator, device.device_identifier))
+    coordinator = entry.runtime_data.coordinator
+    # Only create for MGPP devices
+    devices = [
+        NavienVacationModeDurationNumberEntity(coordinator, device.device_identifier)
+        for device in coordinator.devices_of(MgppDevice)
+    ]
     
     async_add_entities(devices)
 
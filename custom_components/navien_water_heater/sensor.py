@@ -5,9 +5,9 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.helpers.entity import EntityCategory
-from .navien_api import TemperatureType, MgppDevice
+from .navien_api import TemperatureType, MgppDevice, NavilinkDevice
 from .entity import NavienBaseEntity
-from .migration import get_legacy_unique_id_if_exists
+from .migration import get_legacy_unique_id_if_exists, prime_unique_ids
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
@@ -21,10 +21,10 @@ POWER_KCAL_PER_HOUR = 'kcal/hr'
 FLOW_GALLONS_PER_MIN = 'gal/min'
 FLOW_LITERS_PER_MIN = 'liters/min'
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from .const import DOMAIN
+from functools import lru_cache
 import logging
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,6 +62,7 @@ class TempSensorDescription():
         return temp
 
 
+@lru_cache(maxsize=None)
 def get_description(hass_units, navien_units, sensor_type):
     """Get sensor description based on units.
     
@@ -114,111 +115,113 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Navien sensor."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
     sensors = []
     
-    for device in coordinator.devices.values():
+    for device in coordinator.devices_of(MgppDevice):
         device_id = device.device_identifier
-        if isinstance(device, MgppDevice):
-            # MGPP-specific sensors
-            sensors.append(MgppSensor(coordinator, device_id, 'dhwChargePer', 'DHW Charge',
-                                      unit=PERCENTAGE, state_class=SensorStateClass.MEASUREMENT))
-            
-            # Diagnostic sensors - disabled by default
+        # MGPP-specific sensors
+        sensors.append(MgppSensor(coordinator, device_id, 'dhwChargePer', 'DHW Charge',
+                                  unit=PERCENTAGE, state_class=SensorStateClass.MEASUREMENT))
+        
+        # Diagnostic sensors - disabled by default
+        sensors.extend([
+            MgppSensor(coordinator, device_id, 'tankUpperTemperature', 'Tank Upper Temperature',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'tankLowerTemperature', 'Tank Lower Temperature',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'dischargeTemperature', 'Discharge Temperature',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'suctionTemperature', 'Suction Temperature',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'evaporatorTemperature', 'Evaporator Temperature',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'ambientTemperature', 'Ambient Temperature',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'wifiRssi', 'WiFi Signal Strength',
+                      device_class=SensorDeviceClass.SIGNAL_STRENGTH, unit='dBm',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'currentInstPower', 'Power',
+                      device_class=SensorDeviceClass.POWER, unit=UnitOfPower.WATT,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False),
+            # Fan sensors
+            MgppSensor(coordinator, device_id, 'targetFanRpm', 'Target Fan RPM',
+                      unit='RPM', state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'currentFanRpm', 'Current Fan RPM',
+                      unit='RPM', state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            # Error sensors
+            MgppSensor(coordinator, device_id, 'errorCode', 'Error Code',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'subErrorCode', 'Sub Error Code',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            # Energy capacity sensors
+            MgppSensor(coordinator, device_id, 'totalEnergyCapacity', 'Total Energy Capacity',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'availableEnergyCapacity', 'Available Energy Capacity',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            # Heat pump diagnostic sensors
+            MgppSensor(coordinator, device_id, 'eevStep', 'EEV Step',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'currentSuperHeat', 'Current Superheat',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'targetSuperHeat', 'Target Superheat',
+                      device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'currentStatenum', 'Current State Number',
+                      state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+            MgppSensor(coordinator, device_id, 'cumulatedOpTimeEvaFan', 'Evaporator Fan Operating Hours',
+                      device_class=SensorDeviceClass.DURATION, unit=UnitOfTime.HOURS,
+                      state_class=SensorStateClass.TOTAL_INCREASING, enabled_default=False,
+                      entity_category=EntityCategory.DIAGNOSTIC),
+        ])
+        
+        # Recirculation sensors - only if device supports recirculation
+        if device.supports_recirculation:
             sensors.extend([
-                MgppSensor(coordinator, device_id, 'tankUpperTemperature', 'Tank Upper Temperature',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'tankLowerTemperature', 'Tank Lower Temperature',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'dischargeTemperature', 'Discharge Temperature',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'suctionTemperature', 'Suction Temperature',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'evaporatorTemperature', 'Evaporator Temperature',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'ambientTemperature', 'Ambient Temperature',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'wifiRssi', 'WiFi Signal Strength',
-                          device_class=SensorDeviceClass.SIGNAL_STRENGTH, unit='dBm',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'currentInstPower', 'Power',
-                          device_class=SensorDeviceClass.POWER, unit=UnitOfPower.WATT,
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False),
-                # Fan sensors
-                MgppSensor(coordinator, device_id, 'targetFanRpm', 'Target Fan RPM',
-                          unit='RPM', state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'currentFanRpm', 'Current Fan RPM',
-                          unit='RPM', state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                # Error sensors
-                MgppSensor(coordinator, device_id, 'errorCode', 'Error Code',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'subErrorCode', 'Sub Error Code',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                # Energy capacity sensors
-                MgppSensor(coordinator, device_id, 'totalEnergyCapacity', 'Total Energy Capacity',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'availableEnergyCapacity', 'Available Energy Capacity',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                # Heat pump diagnostic sensors
-                MgppSensor(coordinator, device_id, 'eevStep', 'EEV Step',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'currentSuperHeat', 'Current Superheat',
-                          device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
+                MgppSensor(coordinator, device_id, 'recircDhwFlowRate', 'Recirculation Flow Rate',
                           state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
                           entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'targetSuperHeat', 'Target Superheat',
+                MgppSensor(coordinator, device_id, 'recircFaucetTemperature', 'Recirculation Faucet Temperature',
                           device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
                           state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
                           entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'currentStatenum', 'Current State Number',
-                          state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
-                MgppSensor(coordinator, device_id, 'cumulatedOpTimeEvaFan', 'Evaporator Fan Operating Hours',
-                          device_class=SensorDeviceClass.DURATION, unit=UnitOfTime.HOURS,
-                          state_class=SensorStateClass.TOTAL_INCREASING, enabled_default=False,
-                          entity_category=EntityCategory.DIAGNOSTIC),
             ])
-            
-            # Recirculation sensors - only if device supports recirculation
-            if device.supports_recirculation:
-                sensors.extend([
-                    MgppSensor(coordinator, device_id, 'recircDhwFlowRate', 'Recirculation Flow Rate',
-                              state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                              entity_category=EntityCategory.DIAGNOSTIC),
-                    MgppSensor(coordinator, device_id, 'recircFaucetTemperature', 'Recirculation Faucet Temperature',
-                              device_class=SensorDeviceClass.TEMPERATURE, unit=UnitOfTemperature.CELSIUS,
-                              state_class=SensorStateClass.MEASUREMENT, enabled_default=False,
-                              entity_category=EntityCategory.DIAGNOSTIC),
-                ])
-        else:
-            # Legacy sensors
-            navien_units = "us_customary" if device.channel_info.get("temperatureType", 2) == TemperatureType.FAHRENHEIT.value else "metric"
-            hass_units = "us_customary" if hass.config.units.temperature_unit == UnitOfTemperature.FAHRENHEIT else "metric"
-            sensors.append(NavienAvgCalorieSensor(coordinator, device_id))
-            for unit_info in device.channel_status.get("unitInfo", {}).get("unitStatusList", []):
-                for sensor_type in ["gasInstantUsage", "accumulatedGasUsage", "DHWFlowRate", "currentInletTemp", "currentOutletTemp"]:
-                    sensors.append(NavienSensor(hass, coordinator, device_id, unit_info, sensor_type, get_description(hass_units, navien_units, sensor_type)))
     
+    for device in coordinator.devices_of(NavilinkDevice):
+        device_id = device.device_identifier
+        # Legacy sensors
+        navien_units = "us_customary" if device.channel_info.get("temperatureType", 2) == TemperatureType.FAHRENHEIT else "metric"
+        hass_units = "us_customary" if hass.config.units.temperature_unit == UnitOfTemperature.FAHRENHEIT else "metric"
+        sensors.append(NavienAvgCalorieSensor(coordinator, device_id))
+        for unit_info in device.channel_status.get("unitInfo", {}).get("unitStatusList", []):
+            for sensor_type in ["gasInstantUsage", "accumulatedGasUsage", "DHWFlowRate", "currentInletTemp", "currentOutletTemp"]:
+                sensors.append(NavienSensor(hass, coordinator, device_id, unit_info, sensor_type, get_description(hass_units, navien_units, sensor_type)))
+    
+    prime_unique_ids(hass, entry.runtime_data.entity_registry, "sensor", sensors)
     async_add_entities(sensors)
 
 
@@ -295,20 +298,23 @@ class NavienSensor(NavienBaseEntity, SensorEntity):
         else:
             self._attr_name = sensor_description.name
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         hass_units = "us_customary" if self.hass.config.units.temperature_unit == UnitOfTemperature.FAHRENHEIT else "metric"
-        navien_units = "us_customary" if self.device.channel_info.get("temperatureType", 2) == TemperatureType.FAHRENHEIT.value else "metric"
+        navien_units = "us_customary" if self.device.channel_info.get("temperatureType", 2) == TemperatureType.FAHRENHEIT else "metric"
         for unit_info in self.device.channel_status.get("unitInfo", {}).get("unitStatusList", []):
             if unit_info.get("unitNumber", "") == self.unit_number:
                 self.unit_info = unit_info
-        self.sensor_description = get_description(hass_units, navien_units, self.sensor_type)
-        # Update name in case sensor_description.name changed
-        if self.unit_number:
-            self._attr_name = f"Unit {self.unit_number} {self.sensor_description.name}"
-        else:
-            self._attr_name = self.sensor_description.name
-        self.async_write_ha_state()
+        sensor_description = get_description(hass_units, navien_units, self.sensor_type)
+        # Descriptions are cached, so the name only needs rebuilding when the units switch
+        if sensor_description is not self.sensor_description:
+            self.sensor_description = sensor_description
+            if self.unit_number:
+                self._attr_name = f"Unit {self.unit_number} {sensor_description.name}"
+            else:
+                self._attr_name = sensor_description.name
+        super()._handle_coordinator_update()
 
     def _get_legacy_unique_id(self) -> str:
         """Return legacy unique_id format: {mac}{channel}{unit}{type}"""
@@ -423,6 +429,10 @@ class MgppSensor(NavienBaseEntity, SensorEntity):
         """Return the unit of measurement of this entity, if any."""
         return self._unit
 
+    def _state_key(self):
+        """Return availability and value for change detection."""
+        return (self.available, self.native_value)
+
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
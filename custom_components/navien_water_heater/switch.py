@@ -5,39 +5,40 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .entity import NavienBaseEntity
-from .migration import get_legacy_unique_id_if_exists
-from .navien_api import MgppDevice
-from .const import DOMAIN
+from .entity import NavienOnOffEntity
+from .migration import get_legacy_unique_id_if_exists, prime_unique_ids
+from .navien_api import MgppDevice, NavilinkDevice
 
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Navien On Demand switch based on a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
     entities = []
     
-    for device in coordinator.devices.values():
+    for device in coordinator.devices_of(MgppDevice):
         device_id = device.device_identifier
-        if isinstance(device, MgppDevice):
-            # MGPP-specific switches
-            entities.append(MgppAntiLegionellaSwitchEntity(coordinator, device_id))
-            entities.append(MgppFreezeProtectionSwitchEntity(coordinator, device_id))
-            
-            # Hot Button - only if device supports recirculation
-            if device.supports_recirculation:
-                entities.append(MgppHotButtonSwitchEntity(coordinator, device_id))
-        else:
-            # Legacy switches
-            if device.channel_info.get("onDemandUse", 2) == 1:
-                entities.append(NavienOnDemandSwitchEntity(coordinator, device_id))
-            entities.append(NavienPowerSwitchEntity(coordinator, device_id))
+        # MGPP-specific switches
+        entities.append(MgppAntiLegionellaSwitchEntity(coordinator, device_id))
+        entities.append(MgppFreezeProtectionSwitchEntity(coordinator, device_id))
+        
+        # Hot Button - only if device supports recirculation
+        if device.supports_recirculation:
+            entities.append(MgppHotButtonSwitchEntity(coordinator, device_id))
+    
+    for device in coordinator.devices_of(NavilinkDevice):
+        device_id = device.device_identifier
+        # Legacy switches
+        if device.channel_info.get("onDemandUse", 2) == 1:
+            entities.append(NavienOnDemandSwitchEntity(coordinator, device_id))
+        entities.append(NavienPowerSwitchEntity(coordinator, device_id))
     
+    prime_unique_ids(hass, entry.runtime_data.entity_registry, "switch", entities)
     async_add_entities(entities)
 
 
-class NavienOnDemandSwitchEntity(NavienBaseEntity, SwitchEntity):
+class NavienOnDemandSwitchEntity(NavienOnOffEntity, SwitchEntity):
     """Define a Navien Hot Button/On Demand/External Recirculator Entity."""
 
     _attr_name = "Hot Button"
@@ -85,7 +86,7 @@ class NavienOnDemandSwitchEntity(NavienBaseEntity, SwitchEntity):
         await self.device.set_hot_button_state(False)
 
 
-class NavienPowerSwitchEntity(NavienBaseEntity, SwitchEntity):
+class NavienPowerSwitchEntity(NavienOnOffEntity, SwitchEntity):
     """Define a Power Switch Entity."""
 
     _attr_name = "Power"
@@ -133,7 +134,7 @@ class NavienPowerSwitchEntity(NavienBaseEntity, SwitchEntity):
         await self.device.set_power_state(False)
 
 
-class MgppAntiLegionellaSwitchEntity(NavienBaseEntity, SwitchEntity):
+class MgppAntiLegionellaSwitchEntity(NavienOnOffEntity, SwitchEntity):
     """Define an MGPP Anti-Legionella Switch Entity."""
 
     _attr_name = "Anti-Legionella"
@@ -184,7 +185,7 @@ class MgppAntiLegionellaSwitchEntity(NavienBaseEntity, SwitchEntity):
         await self.device.set_anti_legionella_state(False)
 
 
-class MgppFreezeProtectionSwitchEntity(NavienBaseEntity, SwitchEntity):
+class MgppFreezeProtectionSwitchEntity(NavienOnOffEntity, SwitchEntity):
     """Define an MGPP Freeze Protection Switch Entity."""
 
     _attr_name = "Freeze Protection"
@@ -235,7 +236,7 @@ class MgppFreezeProtectionSwitchEntity(NavienBaseEntity, SwitchEntity):
         await self.device.set_freeze_protection_state(False)
 
 
-class MgppHotButtonSwitchEntity(NavienBaseEntity, SwitchEntity):
+class MgppHotButtonSwitchEntity(NavienOnOffEntity, SwitchEntity):
     """Define an MGPP Hot Button/Recirculation Switch Entity."""
 
     _attr_name = "Hot Button"
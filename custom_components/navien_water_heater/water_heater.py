@@ -14,10 +14,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity import NavienBaseEntity
-from .migration import get_legacy_unique_id_if_exists
-from .navien_api import MgppDevice
+from .migration import get_legacy_unique_id_if_exists, prime_unique_ids
+from .navien_api import MgppDevice, NavilinkDevice
 from .water_heater_mgpp import NavienWaterHeaterMgppEntity
-from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,15 +31,18 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Navien water heater based on a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
     
-    entities = []
-    for device in coordinator.devices.values():
-        if isinstance(device, MgppDevice):
-            entities.append(NavienWaterHeaterMgppEntity(coordinator, device.device_identifier))
-        else:
-            entities.append(NavienWaterHeaterEntity(coordinator, device.device_identifier))
+    entities = [
+        NavienWaterHeaterMgppEntity(coordinator, device.device_identifier)
+        for device in coordinator.devices_of(MgppDevice)
+    ]
+    entities.extend(
+        NavienWaterHeaterEntity(coordinator, device.device_identifier)
+        for device in coordinator.devices_of(NavilinkDevice)
+    )
     
+    prime_unique_ids(hass, entry.runtime_data.entity_registry, "water_heater", entities)
     async_add_entities(entities)
 
 
@@ -17,6 +17,24 @@ from .migration import get_legacy_unique_id_if_exists
 
 _LOGGER = logging.getLogger(__name__)
 
+# dhwOperationSetting values reported by MGPP devices
+_OPERATION_MODE_STATES = {
+    0: STATE_OFF,  # standby
+    1: STATE_HEAT_PUMP,
+    2: STATE_ELECTRIC,
+    3: STATE_ECO,
+    4: STATE_HIGH_DEMAND,
+    5: STATE_OFF,  # vacation
+    6: STATE_OFF,  # power off
+}
+
+_STATE_OPERATION_MODES = {
+    STATE_HEAT_PUMP: 1,
+    STATE_ELECTRIC: 2,
+    STATE_ECO: 3,
+    STATE_HIGH_DEMAND: 4,
+}
+
 
 class NavienWaterHeaterMgppEntity(NavienBaseEntity, WaterHeaterEntity):
     """MGPP Navien water heater entity."""
@@ -27,6 +45,16 @@ class NavienWaterHeaterMgppEntity(NavienBaseEntity, WaterHeaterEntity):
         self._cached_unique_id = None
 
     _attr_name = None  # Use device name as entity name
+    # Fixed for every MGPP device, so HA reads them without a property call
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_supported_features = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        | WaterHeaterEntityFeature.OPERATION_MODE
+        | WaterHeaterEntityFeature.AWAY_MODE
+        | WaterHeaterEntityFeature.ON_OFF
+    )
+    _attr_operation_list = [STATE_HEAT_PUMP, STATE_ELECTRIC, STATE_ECO, STATE_HIGH_DEMAND, STATE_OFF]
+    _attr_target_temperature_step = 0.5  # MGPP uses half-degree Celsius increments
 
     def _get_legacy_unique_id(self) -> str:
         """Return legacy unique_id format: {mac}_wh"""
@@ -52,19 +80,6 @@ class NavienWaterHeaterMgppEntity(NavienBaseEntity, WaterHeaterEntity):
         )
         return self._cached_unique_id
 
-    @property
-    def temperature_unit(self):
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def supported_features(self):
-        return (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.OPERATION_MODE
-            | WaterHeaterEntityFeature.AWAY_MODE
-            | WaterHeaterEntityFeature.ON_OFF
-        )
-
     @property
     def is_away_mode_on(self):
         # MGPP vacation = 5
@@ -73,20 +88,7 @@ class NavienWaterHeaterMgppEntity(NavienBaseEntity, WaterHeaterEntity):
     @property
     def current_operation(self):
         mode = self.device.channel_status.get("dhwOperationSetting", 6)
-        mode_map = {
-            0: STATE_OFF,  # standby
-            1: STATE_HEAT_PUMP,
-            2: STATE_ELECTRIC,
-            3: STATE_ECO,
-            4: STATE_HIGH_DEMAND,
-            5: STATE_OFF,  # vacation
-            6: STATE_OFF,  # power off
-        }
-        return mode_map.get(mode, STATE_OFF)
-
-    @property
-    def operation_list(self):
-        return [STATE_HEAT_PUMP, STATE_ELECTRIC, STATE_ECO, STATE_HIGH_DEMAND, STATE_OFF]
+        return _OPERATION_MODE_STATES.get(mode, STATE_OFF)
 
     @property
     def current_temperature(self):
@@ -98,11 +100,6 @@ class NavienWaterHeaterMgppEntity(NavienBaseEntity, WaterHeaterEntity):
         """Target DHW temperature in Celsius."""
         return self.device.dhw_temperature_setting
 
-    @property
-    def target_temperature_step(self):
-        """MGPP uses half-degree Celsius increments."""
-        return 0.5
-
     @property
     def min_temp(self):
         """Minimum temperature in Celsius."""
@@ -131,13 +128,7 @@ class NavienWaterHeaterMgppEntity(NavienBaseEntity, WaterHeaterEntity):
             await self.device.set_power_state(False)
             return
 
-        mode_map = {
-            STATE_HEAT_PUMP: 1,
-            STATE_ELECTRIC: 2,
-            STATE_ECO: 3,
-            STATE_HIGH_DEMAND: 4,
-        }
-        await self.device.set_operation_mode(mode_map.get(operation_mode, 1))
+        await self.device.set_operation_mode(_STATE_OPERATION_MODES.get(operation_mode, 1))
 
     async def async_turn_on(self):
         await self.device.set_power_state(True)